@@ -8,10 +8,15 @@ This module provides a high-level API for frontend applications to:
 """
 
 import json
+import mmap
+import os
 import sys
 import argparse
+import importlib.util
+import itertools
 import logging
-from typing import Dict, Any, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
 from pathlib import Path
 
 from ConfigSpace import ConfigurationSpace, Configuration
@@ -23,6 +28,11 @@ from ConfigSpace.hyperparameters import (
 from openbox.utils.history import History, Observation
 from openbox.utils.constants import SUCCESS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..core import Compressor
 from .step_factory import (
     validate_step_string,
@@ -91,7 +101,7 @@ def create_config_space_from_dict(config_dict: Dict[str, Any]) -> ConfigurationS
 
 
 def load_history_from_dict(
-    history_data: List[Dict[str, Any]],
+    history_data: Iterable[Dict[str, Any]],
     config_space: ConfigurationSpace
 ) -> History:
     """
@@ -118,7 +128,7 @@ def load_history_from_dict(
        }
     
     Args:
-        history_data: List of observations
+        history_data: List (or any iterable, e.g. a streaming reader) of observations
         config_space: ConfigurationSpace instance
     
     Returns:
@@ -126,8 +136,10 @@ def load_history_from_dict(
     """
     num_objectives = 1
     num_constraints = 0
-    if history_data:
-        first_obs = history_data[0]
+    observations = iter(history_data)
+    first_obs = next(observations, None)
+    if first_obs is not None:
+        observations = itertools.chain([first_obs], observations)
         if 'objectives' in first_obs:
             num_objectives = len(first_obs['objectives'])
         if 'constraints' in first_obs and first_obs['constraints'] is not None:
@@ -140,7 +152,8 @@ def load_history_from_dict(
         config_space=config_space
     )
     
-    for obs_data in history_data:
+    parsed_observations = []
+    for obs_data in observations:
         config = Configuration(config_space, values=obs_data['config'])
         
         if 'objectives' in obs_data:
@@ -164,7 +177,8 @@ def load_history_from_dict(
             trial_state=trial_state,
             elapsed_time=obs_data.get('elapsed_time', 0.0)
         )
-        history.update_observation(obs)
+        parsed_observations.append(obs)
+    history.update_observations(parsed_observations)
     
     return history
 
@@ -193,7 +207,7 @@ def load_histories_from_dicts(
         history = load_history_from_dict(history_data, config_space)
         history.task_id = f'source_task_{i}'
         histories.append(history)
-        logger.info(f"Loaded history {i+1}: {len(history.observations)} observations")
+        logger.info("Loaded history %d: %d observations", i + 1, len(history.observations))
     return histories
 
 
@@ -238,7 +252,7 @@ def compress_from_config(
         Dictionary with compression results
     """
     config_space = create_config_space_from_dict(config_space_def)
-    logger.info(f"Created configuration space with {len(config_space.get_hyperparameters())} parameters")
+    logger.info("Created configuration space with %d parameters", len(config_space.get_hyperparameters()))
     
 
     step_strings = []
@@ -263,16 +277,16 @@ def compress_from_config(
         raise ValueError(f"Invalid projection step: {proj_step}")
     
     steps = create_steps_from_strings(step_strings, step_params=step_params)
-    logger.info(f"Created {len(steps)} compression steps")
+    logger.info("Created %d compression steps", len(steps))
     
     # create filling strategy from config if provided
     filling_strategy = None
     filling_config = step_config.get('filling_config')
     if filling_config:
         filling_strategy = create_filling_from_config(filling_config)
-        logger.info(f"Created filling strategy: {type(filling_strategy).__name__}")
+        logger.info("Created filling strategy: %s", type(filling_strategy).__name__)
         if filling_strategy.fixed_values:
-            logger.info(f"Fixed values: {list(filling_strategy.fixed_values.keys())}")
+            logger.info("Fixed values: %s", list(filling_strategy.fixed_values.keys()))
 
     compressor = Compressor(
         config_space=config_space,
@@ -287,11 +301,11 @@ def compress_from_config(
         history = load_history_from_dict(history_dict_list, config_space)
         history.task_id = f'source_task_{i}'
         space_history.append(history)
-        logger.info(f"Loaded history {i+1}: {len(history.observations)} observations")
+        logger.info("Loaded history %d: %d observations", i + 1, len(history.observations))
     
     num_histories = len(space_history)
     source_similarities = {i: 1.0 / num_histories for i in range(num_histories)}
-    logger.info(f"Loaded {len(space_history)} histories with auto-calculated similarities: {source_similarities}")
+    logger.info("Loaded %d histories with auto-calculated similarities: %s", len(space_history), source_similarities)
     
     surrogate_space, sample_space = compressor.compress_space(
         space_history=space_history,
@@ -316,11 +330,110 @@ def compress_from_config(
         result['compression_summary'] = summary
     except:
         pass
-    logger.info(f"Compression completed: {result['original_dim']} -> {result['surrogate_dim']} dimensions")
+    logger.info("Compression completed: %d -> %d dimensions", result['original_dim'], result['surrogate_dim'])
     return result
 
 
-def main():
+_MMAP_MIN_BYTES = 1 << 20
+
+
+def load_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    Decode a JSON file, using orjson when it is installed. Files of 1 MiB
+    or more are memory-mapped and decoded in place rather than copied into
+    a bytes object first.
+    """
+    if orjson is None:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    
+    if os.path.getsize(file_path) < _MMAP_MIN_BYTES:
+        return orjson.loads(Path(file_path).read_bytes())
+    
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as buf:
+            return orjson.loads(buf)
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None else 0
+)
+
+
+def dumps_json(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def write_json(obj: Any, stream=None):
+    """Encode obj once and write it to stream (stdout by default)."""
+    stream = stream or sys.stdout
+    buffer = getattr(stream, 'buffer', None)
+    if orjson is not None and buffer is not None:
+        stream.flush()
+        buffer.write(orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE))
+        buffer.flush()
+        return
+    print(dumps_json(obj), file=stream)
+
+
+def load_history_file(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    hist_data = load_json_file(file_path)
+    if isinstance(hist_data, dict) and 'observations' in hist_data:
+        hist_data = hist_data['observations']
+    return hist_data
+
+
+def prefetch_files(file_paths: List[Path]):
+    """
+    Ask the kernel to start reading all files up front, so the device can
+    service them concurrently while they are decoded one by one.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for file_path in file_paths:
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def iter_history_file(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield observations from a history JSON file using ijson, so large
+    files are never fully materialized. Accepts both a top-level list of
+    observations and a {'observations': [...]} wrapper.
+    """
+    import ijson
+    
+    with open(file_path, 'rb') as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        prefix = 'observations.item' if first == b'{' else 'item'
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def get_parser() -> argparse.ArgumentParser:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description='Dimensio Compression API - Execute compression from JSON configuration'
     )
@@ -359,39 +472,55 @@ def main():
         action='store_true',
         help='Enable verbose logging'
     )
-    
-    args = parser.parse_args()
-    
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Stream history files with ijson instead of loading them fully into memory '
+             '(requires the "streaming" extra)'
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    main_with_args(get_parser().parse_args(argv))
+
+
+def main_with_args(args: argparse.Namespace):
+    """Run the CLI flow on already-parsed arguments, for in-process callers."""
     if args.verbose:
         logging.basicConfig(level=logging.INFO)
     else:
         logging.basicConfig(level=logging.WARNING)
     
+    if args.streaming and importlib.util.find_spec('ijson') is None:
+        print("Error: --streaming requires ijson; install it with: pip install 'dimensio[streaming]'",
+              file=sys.stderr)
+        sys.exit(1)
+    
     config_space_path = Path(args.config_space)
     if not config_space_path.exists():
         print(f"Error: Config space file not found: {args.config_space}", file=sys.stderr)
         sys.exit(1)
-    with open(config_space_path, 'r') as f:
-        config_space_def = json.load(f)
+    config_space_def = load_json_file(config_space_path)
     
     steps_path = Path(args.steps)
     if not steps_path.exists():
         print(f"Error: Steps config file not found: {args.steps}", file=sys.stderr)
         sys.exit(1)
-    with open(steps_path, 'r') as f:
-        step_config = json.load(f)
+    step_config = load_json_file(steps_path)
     
-    histories_list = []
-    for hist_file in args.history:
-        hist_path = Path(hist_file)
+    hist_paths = [Path(hist_file) for hist_file in args.history]
+    for hist_path in hist_paths:
         if not hist_path.exists():
-            print(f"Error: History file not found: {hist_file}", file=sys.stderr)
+            print(f"Error: History file not found: {hist_path}", file=sys.stderr)
             sys.exit(1)
-        with open(hist_path, 'r') as f:
-            hist_data = json.load(f)
-            if isinstance(hist_data, dict) and 'observations' in hist_data:
-                hist_data = hist_data['observations']
-            histories_list.append(hist_data)
+    prefetch_files(hist_paths)
+    
+    if args.streaming:
+        histories_list = [iter_history_file(hist_path) for hist_path in hist_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(hist_paths)))) as executor:
+            histories_list = list(executor.map(load_history_file, hist_paths))
     history_data = histories_list
     
     try:
@@ -403,7 +532,7 @@ def main():
             save_info=not args.no_save
         )
         
-        print(json.dumps(result, indent=2))
+        write_json(result)
         
     except Exception as e:
         error_result = {
@@ -411,7 +540,7 @@ def main():
             'error': str(e),
             'error_type': type(e).__name__
         }
-        print(json.dumps(error_result, indent=2), file=sys.stderr)
+        write_json(error_result, sys.stderr)
         sys.exit(1)
 
 
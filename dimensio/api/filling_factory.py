@@ -4,7 +4,7 @@ Provides functions to create filling strategy instances from string identifiers
 """
 
 from typing import Optional, Dict, Any
-from ..filling import FillingStrategy, DefaultValueFilling
+from ..filling import FillingStrategy, DefaultValueFilling, DEFAULT_FILLING
 from openbox import logger
 
 _FILLING_REGISTRY = {
@@ -81,11 +81,14 @@ def create_filling_from_string(
     if fixed_values is not None:
         default_params['fixed_values'] = fixed_values
     
+    if filling_class is DefaultValueFilling and not default_params:
+        return DEFAULT_FILLING
+    
     try:
         filling = filling_class(**default_params)
         logger.debug(
-            f"Created {filling_class.__name__} from '{filling_str}' "
-            f"with parameters: {default_params}"
+            "Created %s from '%s' with parameters: %s",
+            filling_class.__name__, filling_str, default_params
         )
         return filling
     except Exception as e:
@@ -418,8 +418,8 @@ def create_step_from_string(
     try:
         step = step_class(**default_params)
         logger.debug(
-            f"Created {step_class.__name__} from '{step_str}' "
-            f"with parameters: {default_params}"
+            "Created %s from '%s' with parameters: %s",
+            step_class.__name__, step_str, default_params
         )
         return step
     except Exception as e:
@@ -475,6 +475,6 @@ def create_steps_from_strings(
             logger.error(f"Failed to create step '{step_str}': {e}")
             raise
     
-    logger.info(f"Created {len(steps)} step(s) from {len(step_strings)} string identifier(s)")
+    logger.info("Created %d step(s) from %d string identifier(s)", len(steps), len(step_strings))
     return steps
 
@@ -38,8 +38,8 @@ class Compressor(ABC):
         self._source_similarities: Optional[Dict[int, float]] = None
         
         if filling_strategy is None:
-            from ..filling import DefaultValueFilling
-            self.filling_strategy = DefaultValueFilling()
+            from ..filling import DEFAULT_FILLING
+            self.filling_strategy = DEFAULT_FILLING
         else:
             self.filling_strategy = filling_strategy
         
@@ -233,27 +233,32 @@ class Compressor(ABC):
             logger.warning("No pipeline configured, cannot save compression info")
             return
         
+        original_params = self.origin_config_space.get_hyperparameter_names()
+        sample_params = self.sample_space.get_hyperparameter_names() if self.sample_space else []
+        surrogate_params = self.surrogate_space.get_hyperparameter_names() if self.surrogate_space else []
+        n_original = len(original_params)
+        
         info = {
             'timestamp': datetime.now().isoformat(),
             'event': event,
             'iteration': iteration,
             'spaces': {
                 'original': {
-                    'n_parameters': len(self.origin_config_space.get_hyperparameters()),
-                    'parameters': self.origin_config_space.get_hyperparameter_names()
+                    'n_parameters': n_original,
+                    'parameters': original_params
                 },
                 'sample': {
-                    'n_parameters': len(self.sample_space.get_hyperparameters()) if self.sample_space else 0,
-                    'parameters': self.sample_space.get_hyperparameter_names() if self.sample_space else []
+                    'n_parameters': len(sample_params),
+                    'parameters': sample_params
                 },
                 'surrogate': {
-                    'n_parameters': len(self.surrogate_space.get_hyperparameters()) if self.surrogate_space else 0,
-                    'parameters': self.surrogate_space.get_hyperparameter_names() if self.surrogate_space else []
+                    'n_parameters': len(surrogate_params),
+                    'parameters': surrogate_params
                 }
             },
             'compression_ratios': {
-                'sample_to_original': len(self.sample_space.get_hyperparameters()) / len(self.origin_config_space.get_hyperparameters()) if self.sample_space else 1.0,
-                'surrogate_to_original': len(self.surrogate_space.get_hyperparameters()) / len(self.origin_config_space.get_hyperparameters()) if self.surrogate_space else 1.0
+                'sample_to_original': len(sample_params) / n_original if self.sample_space else 1.0,
+                'surrogate_to_original': len(surrogate_params) / n_original if self.surrogate_space else 1.0
             },
             'pipeline': {
                 'n_steps': len(self.pipeline.steps),
@@ -1,5 +1,5 @@
 from .base import FillingStrategy
-from .default import DefaultValueFilling
+from .default import DefaultValueFilling, DEFAULT_FILLING
 from .clipping import (
     clip_values_to_space,
     is_within_bounds,
@@ -9,6 +9,7 @@ from .clipping import (
 __all__ = [
     'FillingStrategy',
     'DefaultValueFilling',
+    'DEFAULT_FILLING',
     'clip_values_to_space',
     'is_within_bounds',
     'get_out_of_bounds_params',
@@ -1,8 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet
 from ConfigSpace import ConfigurationSpace
+from ConfigSpace.hyperparameters import (
+    UniformFloatHyperparameter,
+    UniformIntegerHyperparameter,
+    CategoricalHyperparameter,
+)
 from openbox import logger
 
+from ..utils.space_cache import SpaceCache
+
+
+def _numeric_default(hp) -> Any:
+    return hp.default_value if hp.default_value is not None else (hp.lower + hp.upper) / 2.0
+
+
+def _categorical_default(hp) -> Any:
+    return hp.default_value if hp.default_value is not None else hp.choices[0]
+
+
+_DEFAULT_GETTERS = {
+    UniformFloatHyperparameter: _numeric_default,
+    UniformIntegerHyperparameter: _numeric_default,
+    CategoricalHyperparameter: _categorical_default,
+}
+
+_NAME_CACHE = SpaceCache()
+
+
+def _hyperparameter_name_set(space: ConfigurationSpace) -> FrozenSet[str]:
+    return frozenset(space.get_hyperparameter_names())
+
+
+def _get_hyperparameter_names(space: ConfigurationSpace) -> FrozenSet[str]:
+    return _NAME_CACHE.get(space, _hyperparameter_name_set)
+
 
 class FillingStrategy(ABC):
     """
@@ -35,8 +67,9 @@ class FillingStrategy(ABC):
             return filled_dict
         
         result_dict = filled_dict.copy()
+        target_names = _get_hyperparameter_names(target_space)
         for param_name, fixed_value in self.fixed_values.items():
-            if param_name in target_space.get_hyperparameter_names():
+            if param_name in target_names:
                 original_value = result_dict.get(param_name)
                 result_dict[param_name] = fixed_value
                 if original_value != fixed_value:
@@ -46,6 +79,10 @@ class FillingStrategy(ABC):
         return result_dict
     
     def get_default_value(self, hp) -> Any:
+        getter = _DEFAULT_GETTERS.get(type(hp))
+        if getter is not None:
+            return getter(hp)
+        
         if hasattr(hp, 'default_value') and hp.default_value is not None:
             return hp.default_value
         
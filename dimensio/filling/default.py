@@ -3,20 +3,27 @@ from ConfigSpace import ConfigurationSpace
 from openbox import logger
 
 from .base import FillingStrategy
+from ..utils.space_cache import SpaceCache
 
 
 class DefaultValueFilling(FillingStrategy):
     def __init__(self, fixed_values: Dict[str, Any] = None):
         super().__init__(fixed_values=fixed_values)
+        self._defaults_cache = SpaceCache()
+    
+    def _compute_defaults(self, target_space: ConfigurationSpace) -> Dict[str, Any]:
+        return {hp.name: self.get_default_value(hp) for hp in target_space.get_hyperparameters()}
+    
+    def _get_defaults(self, target_space: ConfigurationSpace) -> Dict[str, Any]:
+        return self._defaults_cache.get(target_space, self._compute_defaults)
     
     def fill_missing_parameters(self, 
                                 config_dict: Dict[str, Any],
                                 target_space: ConfigurationSpace) -> Dict[str, Any]:
-        filled_dict = config_dict.copy()
-        target_names = target_space.get_hyperparameter_names()
-        for name in target_names:
-            if name not in filled_dict:
-                hp = target_space.get_hyperparameter(name)
-                filled_dict[name] = self.get_default_value(hp)
+        filled_dict = {**self._get_defaults(target_space), **config_dict}
         return self._apply_fixed_values(filled_dict, target_space)
 
+
+# Shared instance for callers without fixed values, so the per-space defaults
+# cache is reused across compressors
+DEFAULT_FILLING = DefaultValueFilling()
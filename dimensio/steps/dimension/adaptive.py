@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from openbox.utils.history import History
 from ConfigSpace import ConfigurationSpace
 
@@ -7,6 +7,7 @@ from .base import DimensionSelectionStep
 from .importance import ImportanceCalculator, SHAPImportanceCalculator
 from ...core import OptimizerProgress
 from ...core.update import UpdateStrategy, PeriodicUpdateStrategy
+from ...utils import extract_numeric_hyperparameters
 from openbox import logger
 
 class AdaptiveDimensionStep(DimensionSelectionStep):    
@@ -33,6 +34,9 @@ class AdaptiveDimensionStep(DimensionSelectionStep):
         
         self.original_space: Optional[ConfigurationSpace] = None
         self.space_history: Optional[List[History]] = None
+        # (key, histories, (param_names, importances)); the histories are kept so
+        # identity can be checked with `is` rather than a recyclable id()
+        self._importance_cache: Optional[Tuple[tuple, tuple, Tuple[List[str], np.ndarray]]] = None
         
         if self.update_strategy:
             logger.info(f"AdaptiveDimensionStep initialized: "
@@ -56,20 +60,38 @@ class AdaptiveDimensionStep(DimensionSelectionStep):
                           input_space: ConfigurationSpace,
                           space_history: Optional[List[History]] = None,
                           source_similarities: Optional[Dict[int, float]] = None) -> List[int]:
-        param_names, importances = self.importance_calculator.calculate_importances(
-            input_space, space_history, source_similarities
+        all_param_names = input_space.get_hyperparameter_names()
+        n_params = len(all_param_names)
+        # Importances only cover numeric parameters, so only those can be selected
+        _, numeric_indices = extract_numeric_hyperparameters(input_space)
+        n_numeric = len(numeric_indices)
+        if (n_numeric > 0 and self.current_topk >= n_numeric and not self.exclude_params and
+                (self.max_dimensions is None or self.max_dimensions >= n_numeric)):
+            # Every numeric parameter would be kept anyway, so skip computing importances
+            logger.debug(f"current_topk={self.current_topk} covers all {n_numeric} numeric parameters, "
+                         f"skipping {self.importance_calculator.get_name()} importances")
+            return numeric_indices
+        
+        histories = tuple(space_history or [])
+        cache_key = (
+            tuple(all_param_names),
+            tuple(len(history.observations) for history in histories),
+            tuple(sorted(source_similarities.items())) if source_similarities else None,
         )
+        cached = self._importance_cache
+        if (cached is not None and cached[0] == cache_key and
+                all(a is b for a, b in zip(cached[1], histories))):
+            logger.debug(f"Reusing {self.importance_calculator.get_name()} importances: history unchanged")
+            param_names, importances = cached[2]
+        else:
+            param_names, importances = self.importance_calculator.calculate_importances(
+                input_space, space_history, source_similarities
+            )
+            self._importance_cache = (cache_key, histories, (param_names, importances))
         
         if len(param_names) == 0:
             logger.warning("No numeric parameters detected, keeping all parameters")
-            return list(range(len(input_space.get_hyperparameter_names())))
-        
-        # Return all parameters sorted by importance (not just topk)
-        # Base class will select current_topk from this sorted list
-        sorted_numeric_indices = np.argsort(importances).tolist()
-        
-        all_param_names = input_space.get_hyperparameter_names()
-        sorted_indices = [all_param_names.index(param_names[i]) for i in sorted_numeric_indices]
+            return list(range(n_params))
         
         # Calculate target topk for logging
         target_topk = min(self.current_topk, len(param_names))
@@ -77,6 +99,15 @@ class AdaptiveDimensionStep(DimensionSelectionStep):
             target_topk = min(target_topk, self.max_dimensions)
         target_topk = max(target_topk, self.min_dimensions)
         
+        # Return all parameters sorted by importance (not just topk)
+        # Base class will select current_topk from this sorted list
+        sorted_numeric_indices = self._argsort_importances(
+            importances, max(self.current_topk, target_topk)
+        )
+        
+        name_to_idx = {name: i for i, name in enumerate(all_param_names)}
+        sorted_indices = [name_to_idx[param_names[i]] for i in sorted_numeric_indices]
+        
         topk_indices = sorted_indices[:target_topk] if target_topk > 0 else []
         topk_names = [all_param_names[i] for i in topk_indices]
         topk_importances = importances[sorted_numeric_indices[:target_topk]] if target_topk > 0 else []
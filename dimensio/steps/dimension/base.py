@@ -1,4 +1,5 @@
 import copy
+import numpy as np
 from typing import Optional, List, Dict
 from openbox.utils.history import History
 from ConfigSpace import ConfigurationSpace
@@ -18,6 +19,7 @@ class DimensionSelectionStep(CompressionStep):
         self.exclude_params = exclude_params or []
         self.selected_indices: Optional[List[int]] = None
         self.selected_param_names: Optional[List[str]] = None
+        self._input_dim: Optional[int] = None
     
     def compress(self, input_space: ConfigurationSpace, 
                 space_history: Optional[List[History]] = None,
@@ -28,13 +30,11 @@ class DimensionSelectionStep(CompressionStep):
         
         # Step 1: Get exclude_params indices
         all_param_names = input_space.get_hyperparameter_names()
-        exclude_indices_set = set()
-        for exclude_name in self.exclude_params:
-            if exclude_name in all_param_names:
-                exclude_indices_set.add(all_param_names.index(exclude_name))
+        name_to_idx = {name: i for i, name in enumerate(all_param_names)}
+        exclude_indices_set = {name_to_idx[name] for name in self.exclude_params if name in name_to_idx}
         
         # Step 2: Get expert parameter indices
-        expert_indices = self._get_expert_param_indices(input_space)
+        expert_indices = self._get_expert_param_indices(input_space, name_to_idx)
         expert_indices = [idx for idx in expert_indices if idx not in exclude_indices_set]
         
         # Step 3: Get method-selected parameters (sorted by importance)
@@ -52,25 +52,30 @@ class DimensionSelectionStep(CompressionStep):
             logger.warning("No parameters selected, returning input space")
             return input_space
         
-        compressed_space = self._create_compressed_space(input_space, selected_indices)
+        compressed_space = self._create_compressed_space(input_space, selected_indices, all_param_names)
         self.selected_indices = selected_indices
-        self.selected_param_names = [input_space.get_hyperparameter_names()[i] for i in selected_indices]
-        logger.debug(f"Dimension selection: {len(input_space.get_hyperparameters())} -> "
-                    f"{len(compressed_space.get_hyperparameters())} parameters")
+        self.selected_param_names = [all_param_names[i] for i in selected_indices]
+        self._input_dim = len(all_param_names)
+        logger.debug(f"Dimension selection: {len(all_param_names)} -> "
+                    f"{len(selected_indices)} parameters")
         logger.debug(f"Selected parameters: {self.selected_param_names}")
         return compressed_space
     
-    def _get_expert_param_indices(self, input_space: ConfigurationSpace) -> List[int]:
+    def _get_expert_param_indices(self, input_space: ConfigurationSpace,
+                                  name_to_idx: Optional[Dict[str, int]] = None) -> List[int]:
         if not self.expert_params:
             return []
         
-        all_param_names = input_space.get_hyperparameter_names()
+        if name_to_idx is None:
+            name_to_idx = {name: i for i, name in enumerate(input_space.get_hyperparameter_names())}
         expert_indices = []
+        seen = set()
         
         for param_name in self.expert_params:
-            if param_name in all_param_names:
-                idx = all_param_names.index(param_name)
-                if idx not in expert_indices:
+            if param_name in name_to_idx:
+                idx = name_to_idx[param_name]
+                if idx not in seen:
+                    seen.add(idx)
                     expert_indices.append(idx)
                     logger.debug(f"Including expert parameter: {param_name}")
             else:
@@ -85,6 +90,28 @@ class DimensionSelectionStep(CompressionStep):
             return self.current_topk
         return None
     
+    def _argsort_importances(self, importances: np.ndarray, topk: Optional[int]) -> List[int]:
+        """
+        Indices ordering importances ascending, where only the head that
+        _merge_expert_and_method_params can consume is guaranteed sorted.
+        Excluded and expert parameters may be skipped while filling topk,
+        so the head is widened by their count; the tail order is irrelevant
+        because merged indices are re-sorted by position.
+        """
+        importances = np.asarray(importances)
+        n = importances.size
+        if topk is None or topk <= 0:
+            return np.argsort(importances).tolist()
+        
+        k = topk + len(self.exclude_params) + len(self.expert_params)
+        if k >= n:
+            return np.argsort(importances).tolist()
+        
+        partitioned = np.argpartition(importances, k - 1)
+        head = partitioned[:k]
+        head = head[np.argsort(importances[head], kind='stable')]
+        return np.concatenate([head, partitioned[k:]]).tolist()
+    
     def _merge_expert_and_method_params(self,
                                        expert_indices: List[int],
                                        method_sorted_indices: List[int],
@@ -151,14 +178,16 @@ class DimensionSelectionStep(CompressionStep):
     
     def _create_compressed_space(self, 
                                  input_space: ConfigurationSpace,
-                                 selected_indices: List[int]) -> ConfigurationSpace:
-        param_names = input_space.get_hyperparameter_names()
+                                 selected_indices: List[int],
+                                 param_names: Optional[List[str]] = None) -> ConfigurationSpace:
+        if param_names is None:
+            param_names = input_space.get_hyperparameter_names()
         selected_names = [param_names[i] for i in selected_indices]
         
         compressed_space = ConfigurationSpace()
-        for name in selected_names:
-            hp = input_space.get_hyperparameter(name)
-            compressed_space.add_hyperparameter(hp)
+        compressed_space.add_hyperparameters(
+            [input_space.get_hyperparameter(name) for name in selected_names]
+        )
         
         return compressed_space
     
@@ -169,15 +198,15 @@ class DimensionSelectionStep(CompressionStep):
         if not self.exclude_params:
             return selected_indices
         
-        all_param_names = input_space.get_hyperparameter_names()
-        result_indices = selected_indices.copy()
+        name_to_idx = {name: i for i, name in enumerate(input_space.get_hyperparameter_names())}
+        result_indices = set(selected_indices)
         excluded_count = 0
         
         for exclude_name in self.exclude_params:
-            if exclude_name in all_param_names:
-                exclude_idx = all_param_names.index(exclude_name)
+            if exclude_name in name_to_idx:
+                exclude_idx = name_to_idx[exclude_name]
                 if exclude_idx in result_indices:
-                    result_indices.remove(exclude_idx)
+                    result_indices.discard(exclude_idx)
                     excluded_count += 1
                     logger.debug(f"Excluded parameter '{exclude_name}' from {step_name}")
                 else:
@@ -235,5 +264,6 @@ class DimensionSelectionStep(CompressionStep):
         if self.exclude_params:
             info['exclude_params'] = self.exclude_params
         if self.input_space:
-            info['compression_ratio'] = len(self.selected_indices) / len(self.input_space.get_hyperparameters())
+            input_dim = self._input_dim or len(self.input_space.get_hyperparameters())
+            info['compression_ratio'] = len(self.selected_indices) / input_dim
         return info
\ No newline at end of file
@@ -37,26 +37,28 @@ class CorrelationDimensionStep(DimensionSelectionStep):
                           input_space: ConfigurationSpace,
                           space_history: Optional[List[History]] = None,
                           source_similarities: Optional[Dict[int, float]] = None) -> List[int]:
+        all_param_names = input_space.get_hyperparameter_names()
+        n_params = len(all_param_names)
         if self.topk <= 0:
             logger.warning(f"No topk provided for {self.method} selection, keeping all parameters")
-            return list(range(len(input_space.get_hyperparameters())))
+            return list(range(n_params))
         
         if not space_history:
             logger.warning(f"No space history provided for {self.method} selection, keeping all parameters")
-            return list(range(len(input_space.get_hyperparameters())))
+            return list(range(n_params))
         
         param_names, importances = self._calculator.calculate_importances(
             input_space, space_history, source_similarities
         )
         if importances is None or np.size(importances) == 0:
             logger.warning(f"{self.method} importances unavailable, keeping all parameters")
-            return list(range(len(input_space.get_hyperparameters())))
+            return list(range(n_params))
         
         # Return all parameters sorted by importance (not just topk)
         # Base class will select topk from this sorted list
-        sorted_numeric_indices = np.argsort(importances).tolist()
-        all_param_names = input_space.get_hyperparameter_names()
-        sorted_indices = [all_param_names.index(param_names[i]) for i in sorted_numeric_indices]
+        sorted_numeric_indices = self._argsort_importances(importances, self._get_target_topk())
+        name_to_idx = {name: i for i, name in enumerate(all_param_names)}
+        sorted_indices = [name_to_idx[param_names[i]] for i in sorted_numeric_indices]
         
         top_k = min(self.topk, len(sorted_indices))
         topk_indices = sorted_indices[:top_k] if top_k > 0 else []
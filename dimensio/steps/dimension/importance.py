@@ -1,6 +1,8 @@
+import logging
+import os
 import numpy as np
-import pandas as pd
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple, Dict
 from openbox.utils.history import History
 from ConfigSpace import ConfigurationSpace
@@ -11,6 +13,134 @@ from ...utils import (
 )
 
 
+_RANK_CACHE_SIZE = 4
+_SHAP_SURROGATES = ('random_forest', 'lightgbm')
+
+
+def _debug_enabled() -> bool:
+    is_enabled_for = getattr(logger, 'isEnabledFor', None)
+    return is_enabled_for is None or is_enabled_for(logging.DEBUG)
+
+
+def _format_ranking(names: List[str], values: np.ndarray, column: str, ascending: bool = True) -> str:
+    order = np.argsort(values, kind='stable')
+    if not ascending:
+        order = order[::-1]
+    width = max([len('feature')] + [len(name) for name in names])
+    lines = [f"{'feature':<{width}}  {column}"]
+    lines.extend(f"{names[i]:<{width}}  {values[i]:.6f}" for i in order)
+    return "\n".join(lines)
+
+
+def _rankdata_cols(data: np.ndarray) -> np.ndarray:
+    """
+    Column-wise ranks with ties averaged, matching
+    ``scipy.stats.rankdata(data, axis=0, method='average')``, from one argsort.
+    """
+    n, m = data.shape
+    order = np.argsort(data, axis=0, kind='stable')
+    positions = np.broadcast_to(np.arange(1, n + 1, dtype=float)[:, None], (n, m))
+    sorted_data = np.take_along_axis(data, order, axis=0)
+    tied = sorted_data[1:] == sorted_data[:-1]
+    
+    if tied.any():
+        # Number tie groups across all columns (column-major) and average positions per group
+        new_group = np.ones((n, m), dtype=bool)
+        new_group[1:] = ~tied
+        group_ids = np.cumsum(new_group.ravel(order='F')) - 1
+        sums = np.bincount(group_ids, weights=positions.ravel(order='F'))
+        counts = np.bincount(group_ids)
+        positions = (sums / counts)[group_ids].reshape((m, n)).T
+    
+    ranks = np.empty((n, m))
+    np.put_along_axis(ranks, order, positions, axis=0)
+    return ranks
+
+
+def _get_spearman_ranks(history: Optional[History],
+                        hist_x: np.ndarray,
+                        hist_y: np.ndarray,
+                        param_names: List[str],
+                        cache: Optional[Dict] = None) -> np.ndarray:
+    """
+    Rank the feature columns and the objective of one task, reusing the ranks
+    stored in ``cache`` when the same history is fed to Spearman again.
+    
+    The last column of the returned matrix holds the objective ranks.
+    """
+    key = (id(history), tuple(param_names), len(hist_x))
+    if history is not None and cache is not None:
+        cached = cache.get(key)
+        # The history itself is kept in the entry so a recycled id cannot match
+        if cached is not None and cached[0] is history:
+            return cached[1]
+    
+    data = np.column_stack([hist_x, np.ravel(hist_y)])
+    ranks = _rankdata_cols(data)
+    if history is not None and cache is not None:
+        if len(cache) >= _RANK_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = (history, ranks)
+    return ranks
+
+
+def _normalized_task_weights(source_similarities: Optional[Dict[int, float]], n_tasks: int) -> np.ndarray:
+    """Task weights summing to 1; missing similarities count as 1.0, a zero total falls back to uniform."""
+    if not source_similarities:
+        return np.full(n_tasks, 1.0 / n_tasks)
+    weights = np.fromiter((source_similarities.get(i, 1.0) for i in range(n_tasks)),
+                          dtype=np.float64, count=n_tasks)
+    weights_sum = weights.sum()
+    if weights_sum > 1e-10:
+        return weights / weights_sum
+    return np.full(n_tasks, 1.0 / n_tasks)
+
+
+def _fit_shap_surrogate(hist_x: np.ndarray, hist_y: np.ndarray, surrogate: str = 'random_forest'):
+    """
+    Fit a tree surrogate on one task and return it together with its SHAP values.
+    
+    'random_forest' explains a RandomForest with shap.TreeExplainer; 'lightgbm'
+    uses LightGBM's native pred_contrib, which computes TreeSHAP in C++.
+    """
+    # Tree learners bin/split on float32 anyway (sklearn casts X internally)
+    hist_x = np.asarray(hist_x, dtype=np.float32)
+    hist_y = np.ravel(hist_y)
+    
+    if surrogate == 'lightgbm':
+        import lightgbm
+        model = lightgbm.LGBMRegressor(n_estimators=100, min_child_samples=5,
+                                       random_state=42, verbose=-1)
+        model.fit(hist_x, hist_y)
+        # The last column of pred_contrib is the expected value, not a feature
+        return model, model.predict(hist_x, pred_contrib=True)[:, :-1]
+    
+    import shap
+    from sklearn.ensemble import RandomForestRegressor
+    
+    model = RandomForestRegressor(n_estimators=100, random_state=42)
+    model.fit(hist_x, hist_y)
+    # shap_values skips building the Explanation object that explainer(...) returns;
+    # approximate (Saabas) attributions are enough since only their ranking is used
+    explainer = shap.TreeExplainer(model, feature_perturbation='tree_path_dependent')
+    return model, explainer.shap_values(hist_x, approximate=True, check_additivity=False)
+
+
+def _target_correlations(data: np.ndarray) -> np.ndarray:
+    """
+    Absolute Pearson correlation of every feature column of ``data`` with its
+    last (objective) column. Applied to ranks this is Spearman. Constant
+    columns are reported as 0.
+    """
+    constant = np.ptp(data, axis=0) == 0
+    if constant[-1]:
+        return np.zeros(data.shape[1] - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.corrcoef(data, rowvar=False)[-1, :-1]
+    corr[constant[:-1]] = 0.0
+    return np.nan_to_num(np.abs(corr), nan=0.0)
+
+
 class ImportanceCalculator(ABC):    
     @abstractmethod
     def calculate_importances(self,
@@ -25,11 +155,25 @@ class ImportanceCalculator(ABC):
 
 
 class SHAPImportanceCalculator(ImportanceCalculator):    
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, surrogate: str = 'random_forest'):
+        """
+        Args:
+            cache_dir: Optional directory where fitted surrogates and their SHAP
+                values are memoized with joblib.Memory, keyed on the task data
+                and surrogate, so that new processes reuse them instead of refitting
+            surrogate: 'random_forest' (default) or 'lightgbm' (requires lightgbm)
+        """
+        if surrogate not in _SHAP_SURROGATES:
+            raise ValueError(f"Unknown SHAP surrogate '{surrogate}', expected one of {_SHAP_SURROGATES}")
+        self.cache_dir = cache_dir
+        self.surrogate = surrogate
+        self._fit_surrogate = _fit_shap_surrogate
+        if cache_dir is not None:
+            from joblib import Memory
+            self._fit_surrogate = Memory(os.path.expanduser(cache_dir), verbose=0).cache(_fit_shap_surrogate)
         self._cache = {
             'models': None,
             'importances': None,
-            'shap_values': None,
             'n_features': None,
             'importances_per_task': None,  # Store per-task importances for multi-task visualization
             'task_names': None,  # Store task names
@@ -62,12 +206,8 @@ class SHAPImportanceCalculator(ImportanceCalculator):
                                  space_history: List[History],
                                  input_space: ConfigurationSpace,
                                  source_similarities: Optional[Dict[int, float]] = None) -> np.ndarray:
-        import shap
-        from sklearn.ensemble import RandomForestRegressor
-        
         models = []
         importances_list = []
-        shap_values = []
         
         if len(space_history) == 0:
             logger.warning("No historical data provided for SHAP")
@@ -78,46 +218,35 @@ class SHAPImportanceCalculator(ImportanceCalculator):
             top_ratio=1.0, normalize=True
         )
         
-        for task_idx, (hist_x_numeric, hist_y) in enumerate(zip(all_x, all_y)):
-            if len(hist_x_numeric) == 0:
-                continue
-            
-            model = RandomForestRegressor(n_estimators=100, random_state=42)
-            model.fit(hist_x_numeric, hist_y)
-            
-            explainer = shap.Explainer(model)
-            shap_value = -np.abs(explainer(hist_x_numeric, check_additivity=False).values)
-            mean_shap = shap_value.mean(axis=0)
+        task_indices = [i for i, hist_x_numeric in enumerate(all_x) if len(hist_x_numeric) > 0]
+        task_x = [all_x[i] for i in task_indices]
+        task_y = [all_y[i] for i in task_indices]
+        if len(task_indices) > 1:
+            # Tree fitting and TreeSHAP run in native code that releases the GIL
+            n_workers = min(len(task_indices), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                fitted = list(executor.map(self._fit_surrogate, task_x, task_y,
+                                           [self.surrogate] * len(task_x)))
+        else:
+            fitted = [self._fit_surrogate(x, y, self.surrogate) for x, y in zip(task_x, task_y)]
+        
+        for task_idx, (model, shap_value) in zip(task_indices, fitted):
+            mean_shap = -np.abs(shap_value).mean(axis=0)
             
             models.append(model)
             importances_list.append(mean_shap)
-            shap_values.append(shap_value)
             
-            df = pd.DataFrame({
-                "feature": self.numeric_hyperparameter_names,
-                "importance": mean_shap,
-            }).sort_values("importance", ascending=True)
-            logger.debug(f"SHAP importance (task {task_idx}): {df.to_string()}")
+            if _debug_enabled():
+                table = _format_ranking(self.numeric_hyperparameter_names, mean_shap, "importance")
+                logger.debug(f"SHAP importance (task {task_idx}):\n{table}")
         
         if len(importances_list) == 0:
             logger.warning("No SHAP importances computed")
             return None
         
         importances_array = np.array(importances_list)
-        if source_similarities:
-            weights = np.array([
-                source_similarities.get(task_idx, 1.0) 
-                for task_idx in range(len(importances_list))
-            ])
-            weights_sum = weights.sum()
-            if weights_sum > 1e-10:
-                weights = weights / weights_sum
-            else:
-                weights = np.ones(len(importances_list)) / len(importances_list)
-        else:
-            weights = np.ones(len(importances_list)) / len(importances_list)
-        
-        importances = np.average(importances_array, axis=0, weights=weights)
+        weights = _normalized_task_weights(source_similarities, len(importances_list))
+        importances = weights @ importances_array
         
         # Extract task names from history
         task_names = []
@@ -130,7 +259,6 @@ class SHAPImportanceCalculator(ImportanceCalculator):
         self._cache.update({
             'models': models,
             'importances': importances,
-            'shap_values': shap_values,
             'n_features': len(self.numeric_hyperparameter_names),
             'importances_per_task': importances_array if len(importances_array) > 1 else None,  # Only save if multiple tasks
             'task_names': task_names if len(task_names) > 1 else None,
@@ -154,6 +282,8 @@ class CorrelationImportanceCalculator(ImportanceCalculator):
             'importances_per_task': None,
             'task_names': None,
         }
+        # (id(history), param names, n_samples) -> (history, ranks), evicted FIFO
+        self._rank_cache: Dict = {}
         self.numeric_hyperparameter_names: List[str] = []
     
     def calculate_importances(self,
@@ -163,9 +293,9 @@ class CorrelationImportanceCalculator(ImportanceCalculator):
         numeric_param_names, _ = extract_numeric_hyperparameters(input_space)
         self.numeric_hyperparameter_names = numeric_param_names
         
-        all_x, all_y = extract_top_samples_from_history(
+        all_x, all_y, sample_history_indices = extract_top_samples_from_history(
             space_history, numeric_param_names, input_space,
-            top_ratio=1.0, normalize=True
+            top_ratio=1.0, normalize=True, return_history_indices=True
         )
         if len(all_x) == 0:
             logger.warning("No data available for correlation")
@@ -174,8 +304,15 @@ class CorrelationImportanceCalculator(ImportanceCalculator):
         if not source_similarities:
             source_similarities = {i: 1.0 for i in range(len(all_x))}
         
+        # Map each extracted task back to its History so that its ranks can be reused
+        task_histories = []
+        offset = 0
+        for hist_x_numeric in all_x:
+            task_histories.append(space_history[sample_history_indices[offset]])
+            offset += len(hist_x_numeric)
+        
         importances, importances_per_task = self._compute_weighted_correlations(
-            all_x, all_y, numeric_param_names, source_similarities
+            all_x, all_y, numeric_param_names, source_similarities, task_histories
         )
         
         # Extract task names from history
@@ -192,68 +329,45 @@ class CorrelationImportanceCalculator(ImportanceCalculator):
             'task_names': task_names if len(all_x) > 1 else None,
         })
         
-        df = pd.DataFrame({
-            "feature": numeric_param_names,
-            "importance": importances,
-        }).sort_values("importance", ascending=True)
-        logger.debug(f"{self.method.capitalize()} correlation importance: {df.to_string()}")
+        if _debug_enabled():
+            table = _format_ranking(numeric_param_names, importances, "importance")
+            logger.debug(f"{self.method.capitalize()} correlation importance:\n{table}")
         
         return numeric_param_names, importances
     
     def _compute_weighted_correlations(self, all_x, all_y, numeric_param_names,
-                                    source_similarities):
+                                    source_similarities, task_histories=None):
         """
         Compute weighted correlations based on task similarities.
         
         Single task is treated as having similarity=1.0.
         """
-        from scipy.stats import spearmanr, pearsonr
-                
         correlations_list = []
         for task_idx, (hist_x_numeric, hist_y) in enumerate(zip(all_x, all_y)):
             if len(hist_x_numeric) == 0:
                 continue
             
-            n_features = hist_x_numeric.shape[1]
-            correlations = np.zeros(n_features)
-            
-            for i in range(n_features):
-                try:
-                    if self.method == 'spearman':
-                        corr, _ = spearmanr(hist_x_numeric[:, i], hist_y.flatten())
-                    else:
-                        corr, _ = pearsonr(hist_x_numeric[:, i], hist_y.flatten())
-                    
-                    correlations[i] = abs(corr) if not np.isnan(corr) else 0.0
-                except Exception as e:
-                    logger.warning(f"Failed to compute {self.method} correlation for feature {i}: {e}")
-                    correlations[i] = 0.0
+            if self.method == 'spearman':
+                history = task_histories[task_idx] if task_histories is not None else None
+                data = _get_spearman_ranks(history, hist_x_numeric, hist_y, numeric_param_names,
+                                           cache=self._rank_cache)
+            else:
+                data = np.column_stack([hist_x_numeric, np.ravel(hist_y)])
+            correlations = _target_correlations(data)
             
             correlations_list.append(correlations)
             
-            df = pd.DataFrame({
-                "feature": numeric_param_names,
-                "correlation": correlations,
-            }).sort_values("correlation", ascending=False)
-            logger.debug(f"{self.method.capitalize()} correlations (task {task_idx}): {df.to_string()}")
+            if _debug_enabled():
+                table = _format_ranking(numeric_param_names, correlations, "correlation", ascending=False)
+                logger.debug(f"{self.method.capitalize()} correlations (task {task_idx}):\n{table}")
         
         if len(correlations_list) == 0:
             logger.warning("No correlations computed")
             return np.ones(len(numeric_param_names)), None
         
         correlations_array = np.array(correlations_list)
-        weights = np.array([
-            source_similarities.get(task_idx, 1.0)  # Default to 1.0 if not specified
-            for task_idx in range(len(correlations_list))
-        ])
-        weights_sum = weights.sum()
-        
-        if weights_sum > 1e-10:
-            weights = weights / weights_sum
-        else:
-            weights = np.ones(len(correlations_list)) / len(correlations_list)
-        
-        correlations = np.average(correlations_array, axis=0, weights=weights)
+        weights = _normalized_task_weights(source_similarities, len(correlations_list))
+        correlations = weights @ correlations_array
         
         # Return weighted importance and per-task data (only for multiple tasks)
         importances = -correlations
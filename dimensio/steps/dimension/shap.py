@@ -15,10 +15,12 @@ class SHAPDimensionStep(DimensionSelectionStep):
                  topk: int = 20,
                  expert_params: Optional[List[str]] = None,
                  exclude_params: Optional[List[str]] = None,
+                 cache_dir: Optional[str] = None,
+                 surrogate: str = 'random_forest',
                  **kwargs):
         super().__init__(strategy=strategy, expert_params=expert_params, exclude_params=exclude_params, **kwargs)
         self.topk = 0 if strategy == 'none' else topk
-        self._calculator = SHAPImportanceCalculator()
+        self._calculator = SHAPImportanceCalculator(cache_dir=cache_dir, surrogate=surrogate)
         logger.debug(f"SHAPDimensionStep initialized: topk={topk}, expert_params={len(self.expert_params)}, exclude_params={len(self.exclude_params)}")
     
     def get_step_info(self) -> dict:
@@ -35,13 +37,15 @@ class SHAPDimensionStep(DimensionSelectionStep):
                         input_space: ConfigurationSpace,
                         space_history: Optional[List[History]] = None,
                         source_similarities: Optional[Dict[int, float]] = None) -> List[int]:
+        all_param_names = input_space.get_hyperparameter_names()
+        n_params = len(all_param_names)
         if self.topk <= 0:
             logger.warning("No topk provided for SHAP selection, keeping all parameters")
-            return list(range(len(input_space.get_hyperparameters())))
+            return list(range(n_params))
         
         if not space_history:
             logger.warning("No space history provided for SHAP selection, keeping all parameters")
-            return list(range(len(input_space.get_hyperparameters())))
+            return list(range(n_params))
         
         param_names, importances = self._calculator.calculate_importances(
             input_space, space_history, source_similarities
@@ -49,14 +53,14 @@ class SHAPDimensionStep(DimensionSelectionStep):
         
         if importances is None or np.size(importances) == 0:
             logger.warning("SHAP importances unavailable, keeping all parameters")
-            return list(range(len(input_space.get_hyperparameters())))
+            return list(range(n_params))
         
         # Return all parameters sorted by importance (not just topk)
         # Base class will select topk from this sorted list
-        sorted_numeric_indices = np.argsort(importances).tolist()
+        sorted_numeric_indices = self._argsort_importances(importances, self._get_target_topk())
         # sorted_numeric_indices.reverse()
-        all_param_names = input_space.get_hyperparameter_names()
-        sorted_indices = [all_param_names.index(param_names[i]) for i in sorted_numeric_indices]
+        name_to_idx = {name: i for i, name in enumerate(all_param_names)}
+        sorted_indices = [name_to_idx[param_names[i]] for i in sorted_numeric_indices]
         
         top_k = min(self.topk, len(sorted_indices))
         topk_indices = sorted_indices[:top_k] if top_k > 0 else []
@@ -12,6 +12,8 @@ class TransformativeProjectionStep(CompressionStep):
     def __init__(self, method: str = 'rembo', **kwargs):
         super().__init__('transformative_projection', **kwargs)
         self.method = method
+        # (active_hps, normalizers) built for the last active_hps list seen
+        self._normalizers = None
     
     def compress(self, input_space: ConfigurationSpace, 
                 space_history: Optional[List[History]] = None,
@@ -43,31 +45,67 @@ class TransformativeProjectionStep(CompressionStep):
             info['low_dim'] = self.low_dim
         return info
     
-    def _normalize_high_dim_config(self, high_dim_dict: dict, active_hps: List[CSH.Hyperparameter]) -> np.ndarray:
-        high_dim_values = []
-        for hp in active_hps:
-            value = high_dim_dict.get(hp.name)
-            if value is None:
-                if hasattr(hp, 'default_value'):
-                    value = hp.default_value
-                elif hasattr(hp, 'lower') and hasattr(hp, 'upper'):
-                    value = (hp.lower + hp.upper) / 2
-                elif hasattr(hp, 'choices'):
-                    value = hp.choices[0]
-                else:
-                    logger.warning(f"Cannot determine value for {hp.name}, using 0.5")
-                    high_dim_values.append(0.5)
-                    continue
-            # normalize to [0, 1]
+    def _get_normalizers(self, active_hps: List[CSH.Hyperparameter]):
+        """
+        Per-hyperparameter normalization data for ``active_hps``, rebuilt only
+        when a different list of hyperparameters is passed.
+        """
+        cached = getattr(self, '_normalizers', None)
+        if cached is not None and cached[0] is active_hps:
+            return cached[1]
+        
+        numeric_idx, numeric_names, numeric_defaults, lowers, spans = [], [], [], [], []
+        others = []
+        for i, hp in enumerate(active_hps):
             if hasattr(hp, 'lower') and hasattr(hp, 'upper'):
-                normalized = (value - hp.lower) / (hp.upper - hp.lower)
+                numeric_idx.append(i)
+                numeric_names.append(hp.name)
+                numeric_defaults.append(hp.default_value if hasattr(hp, 'default_value')
+                                        else (hp.lower + hp.upper) / 2)
+                lowers.append(hp.lower)
+                spans.append(hp.upper - hp.lower)
+                continue
+            
+            positions = None
+            if hasattr(hp, 'choices'):
+                positions = {}
+                denom = max(1, len(hp.choices) - 1)
+                for j, choice in enumerate(hp.choices):
+                    positions.setdefault(choice, j / denom)
+            if hasattr(hp, 'default_value'):
+                default = hp.default_value
             elif hasattr(hp, 'choices'):
-                try:
-                    normalized = hp.choices.index(value) / max(1, len(hp.choices) - 1)
-                except ValueError:
-                    normalized = 0.5
+                default = hp.choices[0]
             else:
-                normalized = 0.5
-            high_dim_values.append(normalized)
-        return np.array(high_dim_values)
-
+                default = None
+            others.append((i, hp.name, default, positions))
+        
+        normalizers = (
+            np.array(numeric_idx, dtype=int), numeric_names, numeric_defaults,
+            np.array(lowers, dtype=float), np.array(spans, dtype=float), others,
+        )
+        self._normalizers = (active_hps, normalizers)
+        return normalizers
+    
+    def _normalize_high_dim_config(self, high_dim_dict: dict, active_hps: List[CSH.Hyperparameter]) -> np.ndarray:
+        numeric_idx, numeric_names, numeric_defaults, lowers, spans, others = \
+            self._get_normalizers(active_hps)
+        high_dim_values = np.full(len(active_hps), 0.5)
+        
+        if len(numeric_idx) > 0:
+            values = [high_dim_dict.get(name) for name in numeric_names]
+            raw = np.array([default if value is None else value
+                            for value, default in zip(values, numeric_defaults)], dtype=float)
+            # normalize to [0, 1]
+            high_dim_values[numeric_idx] = (raw - lowers) / spans
+        
+        for i, name, default, positions in others:
+            value = high_dim_dict.get(name)
+            if value is None:
+                if default is None:
+                    logger.warning(f"Cannot determine value for {name}, using 0.5")
+                    continue
+                value = default
+            if positions is not None:
+                high_dim_values[i] = positions.get(value, 0.5)
+        return high_dim_values
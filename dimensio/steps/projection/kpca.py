@@ -72,17 +72,15 @@ class KPCAProjectionStep(TransformativeProjectionStep):
         return projected_space
     
     def _train_kpca(self, input_space: ConfigurationSpace):
-        all_x, all_y = extract_top_samples_from_history(
+        X_combined, _ = extract_top_samples_from_history(
             self.space_history, self.numeric_param_names, input_space,
-            top_ratio=1.0, normalize=True
+            top_ratio=1.0, normalize=True, stacked=True
         )
         
-        if len(all_x) == 0:
+        if len(X_combined) == 0:
             logger.warning("No historical data available for KPCA training")
             return
         
-        X_combined = np.vstack(all_x)
-        
         if X_combined.shape[0] < self.n_components:
             logger.warning(
                 f"Insufficient samples for KPCA: {X_combined.shape[0]} < {self.n_components}. "
@@ -3,12 +3,21 @@ from ConfigSpace import ConfigurationSpace, Configuration
 import ConfigSpace as CS
 import ConfigSpace.hyperparameters as CSH
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 from openbox import logger
 from .base import TransformativeProjectionStep
 from ...core import OptimizerProgress
 
 
+def _quantize(value, lower, upper, num_values):
+    # original value [lower, upper] -> quantized value [1, num_values]
+    return 1 + (value - lower) * ((num_values - 1) or 1) / (upper - lower)
+
+
+def _dequantize(value, lower, upper, num_values):
+    # quantized value [1, num_values] -> original value [lower, upper]
+    return lower + (value - 1) * (upper - lower) / ((num_values - 1) or 1)
+
+
 class QuantizationProjectionStep(TransformativeProjectionStep):
     def __init__(self, 
                  method: str = 'quantization',
@@ -20,11 +29,15 @@ class QuantizationProjectionStep(TransformativeProjectionStep):
         self.seed = seed
         self._rs = np.random.RandomState(seed=seed)
         
+        # name -> (lower, upper, max_num_values) of each quantized knob
         self._knobs_scalers: dict = {}
+        # name -> (quantized name, lower, upper, num_values), precomputed for project_point
+        self._project_plan: dict = {}
         self.adaptive = adaptive
     
     def _build_projected_space(self, input_space: ConfigurationSpace) -> ConfigurationSpace:
         self._knobs_scalers = {}
+        self._project_plan = {}
         root_hyperparams = []
         quantized_params = []
         unchanged_params = []
@@ -43,12 +56,11 @@ class QuantizationProjectionStep(TransformativeProjectionStep):
             # Quantize knob
             # original value: [lower, upper] => quantized value: [1, max_num_values]
             lower, upper = adaptee_hp.lower, adaptee_hp.upper
-            scaler = MinMaxScaler(feature_range=(lower, upper))
-            scaler.fit([[1], [self._max_num_values]])
-            self._knobs_scalers[adaptee_hp.name] = scaler
+            self._knobs_scalers[adaptee_hp.name] = (lower, upper, self._max_num_values)
+            self._project_plan[adaptee_hp.name] = (f'{adaptee_hp.name}|q', lower, upper, self._max_num_values)
             
             default_value = round(
-                scaler.inverse_transform([[adaptee_hp.default_value]])[0][0]
+                _quantize(adaptee_hp.default_value, lower, upper, self._max_num_values)
             )
             default_value = max(1, min(self._max_num_values, default_value))
             
@@ -96,7 +108,7 @@ class QuantizationProjectionStep(TransformativeProjectionStep):
     
     def unproject_point(self, point: Configuration) -> dict:
         coords = point.get_dictionary() if hasattr(point, 'get_dictionary') else dict(point)
-        valid_dim_names = [dim.name for dim in self.input_space.get_hyperparameters()]
+        valid_dim_names = set(self.input_space.get_hyperparameter_names())
         unproject_coords = {}
         
         for name, value in coords.items():
@@ -112,10 +124,9 @@ class QuantizationProjectionStep(TransformativeProjectionStep):
                 unproject_coords[name] = value
                 continue
             
-            scaler = self._knobs_scalers[dim_name]
-            lower, upper = scaler.feature_range
+            lower, upper, num_values = self._knobs_scalers[dim_name]
             
-            value = int(scaler.transform([[value]])[0][0])
+            value = int(_dequantize(value, lower, upper, num_values))
             value = max(lower, min(upper, value))
             unproject_coords[dim_name] = value
         
@@ -130,21 +141,18 @@ class QuantizationProjectionStep(TransformativeProjectionStep):
             original_dict = dict(point)
         
         quantized_dict = {}
+        plan = self._project_plan
+        max_num_values = self._max_num_values
         
         for name, value in original_dict.items():
-            if name in self._knobs_scalers:
-                scaler = self._knobs_scalers[name]
-                # Use inverse_transform:
-                # original value [lower, upper] -> quantized value [1, max_num_values]
-                # The scaler maps [1, max_num_values] -> [lower, upper],
-                # so inverse maps [lower, upper] -> [1, max_num_values]
-                lower, upper = scaler.feature_range
-                value_clamped = max(lower, min(upper, value))
-                quantized_value = round(scaler.inverse_transform([[value_clamped]])[0][0])
-                quantized_value = max(1, min(self._max_num_values, quantized_value))
-                quantized_dict[f'{name}|q'] = quantized_value
-            else:
+            entry = plan.get(name)
+            if entry is None:
                 quantized_dict[name] = value
+                continue
+            q_name, lower, upper, num_values = entry
+            value_clamped = lower if value < lower else upper if value > upper else value
+            quantized_value = round(_quantize(value_clamped, lower, upper, num_values))
+            quantized_dict[q_name] = max(1, min(max_num_values, quantized_value))
         
         return quantized_dict
     
@@ -15,14 +15,22 @@ class REMBOProjectionStep(TransformativeProjectionStep):
                  low_dim: int = 10,
                  max_num_values: Optional[int] = None,
                  seed: int = 42,
+                 dtype: type = np.float64,
+                 use_sparse: bool = False,
+                 sparse_density: float = 0.1,
                  **kwargs):
         super().__init__(method=method, **kwargs)
         self.low_dim = low_dim
         self._max_num_values = max_num_values
         self.seed = seed
         self._rs = np.random.RandomState(seed=seed)
+        # np.float32 opts into half the memory traffic of the unprojection matmul
+        self.dtype = np.dtype(dtype)
+        # sparse random embedding (scipy.sparse) for very high-dimensional spaces
+        self.use_sparse = use_sparse
+        self.sparse_density = sparse_density
         
-        # Projection matrix and scalers
+        # Projection matrix (scipy.sparse CSR when use_sparse) and scalers
         self._A: Optional[np.ndarray] = None
         self._scaler: Optional[MinMaxScaler] = None
         self._q_scaler: Optional[MinMaxScaler] = None
@@ -80,9 +88,17 @@ class REMBOProjectionStep(TransformativeProjectionStep):
             np.array([-bbound_vector, bbound_vector])
         )
         
-        self._A = self._rs.normal(
-            0, 1, (len(self.active_hps), self.low_dim)
-        )
+        if self.use_sparse:
+            from scipy import sparse
+            self._A = sparse.random(
+                len(self.active_hps), self.low_dim,
+                density=self.sparse_density, format='csr', dtype=self.dtype,
+                random_state=self._rs, data_rvs=self._rs.standard_normal
+            )
+        else:
+            self._A = self._rs.normal(
+                0, 1, (len(self.active_hps), self.low_dim)
+            ).astype(self.dtype, copy=False)
         
         return target
     
@@ -104,10 +120,9 @@ class REMBOProjectionStep(TransformativeProjectionStep):
             low_dim_point = low_dim_point_raw
         
         # Project: (-sqrt(low_dim), sqrt(low_dim)) -> (0, 1)
-        high_dim_point = [
-            np.dot(self._A[idx, :], low_dim_point)
-            for idx in range(len(self.active_hps))
-        ]
+        high_dim_point = self._A @ np.asarray(low_dim_point, dtype=self.dtype)
+        # back to float64 so ConfigSpace receives plain float values
+        high_dim_point = np.asarray(high_dim_point, dtype=np.float64)
         high_dim_point = self._scaler.transform([high_dim_point])[0]
         
         # Transform back to original space
@@ -149,7 +164,8 @@ class REMBOProjectionStep(TransformativeProjectionStep):
         
         # pseudoinverse projection: A+ @ high_dim = low_dim
         # where A+ = (A^T @ A)^(-1) @ A^T (Moore-Penrose pseudoinverse)
-        A_pinv = np.linalg.pinv(self._A)
+        A_dense = self._A.toarray() if self.use_sparse else self._A
+        A_pinv = np.linalg.pinv(A_dense)
         low_dim_approx = A_pinv @ high_dim_scaled
         
         if self._max_num_values is not None and self._q_scaler is not None:
@@ -189,6 +205,9 @@ class REMBOProjectionStep(TransformativeProjectionStep):
     def get_step_info(self) -> dict:
         info = super().get_step_info()
         info['low_dim'] = self.low_dim
+        info['dtype'] = self.dtype.name
+        if self.use_sparse:
+            info['sparse_density'] = self.sparse_density
         if self._max_num_values is not None:
             info['max_num_values'] = self._max_num_values
         return info
\ No newline at end of file
@@ -91,7 +91,7 @@ class RangeCompressionStep(CompressionStep):
                                   space_history: Optional[List[History]] = None,
                                   source_similarities: Optional[Dict[int, float]] = None,
                                   **kwargs) -> ConfigurationSpace:
-        return copy.deepcopy(input_space)
+        return input_space
     
     def project_point(self, point) -> dict:
         # project a point from input_space to output_space.
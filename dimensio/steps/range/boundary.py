@@ -1,4 +1,3 @@
-import copy
 import numpy as np
 import pandas as pd
 from typing import Optional, List, Tuple, Dict
@@ -18,20 +17,38 @@ class BoundaryRangeStep(RangeCompressionStep):
     @staticmethod
     def _clamp_range_bounds(min_val: float, max_val: float, 
                             param_values: np.ndarray,
-                            original_space: ConfigurationSpace,
-                            param_name: str) -> Tuple[float, float]:
+                            original_min: float,
+                            original_max: float) -> Tuple[float, float]:
         if min_val > max_val:
             min_val = np.min(param_values)
             max_val = np.max(param_values)
         
-        hp = original_space.get_hyperparameter(param_name)
-        original_min = hp.lower
-        original_max = hp.upper
-        
         min_val = max(min_val, original_min)
         max_val = min(max_val, original_max)
         return min_val, max_val
     
+    @staticmethod
+    def _clamp_range_bounds_vec(min_vals: np.ndarray, max_vals: np.ndarray,
+                                values_min: np.ndarray, values_max: np.ndarray,
+                                original_mins: np.ndarray,
+                                original_maxs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array form of _clamp_range_bounds for all parameters at once; values_min and
+        values_max are the per-parameter sample extremes used when min_val > max_val.
+        """
+        invalid = min_vals > max_vals
+        min_vals = np.maximum(np.where(invalid, values_min, min_vals), original_mins)
+        max_vals = np.minimum(np.where(invalid, values_max, max_vals), original_maxs)
+        return min_vals, max_vals
+    
+    @staticmethod
+    def _get_numeric_bounds(space: ConfigurationSpace,
+                            numeric_param_names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        hps = [space.get_hyperparameter(name) for name in numeric_param_names]
+        lowers = np.fromiter((hp.lower for hp in hps), dtype=np.float64, count=len(hps))
+        uppers = np.fromiter((hp.upper for hp in hps), dtype=np.float64, count=len(hps))
+        return lowers, uppers
+    
     def __init__(self, 
                  method: str = 'boundary',
                  top_ratio: float = 0.8,
@@ -54,16 +71,17 @@ class BoundaryRangeStep(RangeCompressionStep):
                                 source_similarities: Optional[Dict[int, float]] = None) -> ConfigurationSpace:
         if not space_history:
             logger.warning("No space history provided for boundary compression, returning input space")
-            return copy.deepcopy(input_space)
+            return input_space
         
         numeric_param_names, _ = extract_numeric_hyperparameters(input_space)
         
         if not numeric_param_names:
             logger.warning("No numeric hyperparameters found, returning input space")
-            return copy.deepcopy(input_space)
+            return input_space
         
         compressed_ranges = self._compute_simple_ranges(
-            space_history, numeric_param_names, input_space
+            space_history, numeric_param_names, input_space,
+            bounds=self._get_numeric_bounds(input_space, numeric_param_names)
         )
 
         compressed_space = create_space_from_ranges(input_space, compressed_ranges)
@@ -73,46 +91,44 @@ class BoundaryRangeStep(RangeCompressionStep):
     def _compute_simple_ranges(self, 
                             space_history: List[History],
                             numeric_param_names: List[str],
-                            original_space: ConfigurationSpace) -> Dict[str, Tuple[float, float]]:
-        all_x, _ = extract_top_samples_from_history(
+                            original_space: ConfigurationSpace,
+                            bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Dict[str, Tuple[float, float]]:
+        X_combined, _ = extract_top_samples_from_history(
             space_history, numeric_param_names, original_space,
-            top_ratio=self.top_ratio, normalize=True
+            top_ratio=self.top_ratio, normalize=True, stacked=True
         )
         
-        if len(all_x) == 0:
+        if len(X_combined) == 0:
             return {}
         
-        X_combined = np.vstack(all_x)
-        
         fixed_params = self._get_fixed_params()
         
+        # Column-wise statistics for all parameters at once
+        mean = X_combined.mean(axis=0)
+        std = X_combined.std(axis=0)
+        col_min = X_combined.min(axis=0)
+        col_max = X_combined.max(axis=0)
+        min_vals_norm = np.maximum(col_min, mean - self.sigma * std)
+        max_vals_norm = np.minimum(col_max, mean + self.sigma * std)
+        
+        lowers, uppers = bounds or self._get_numeric_bounds(original_space, numeric_param_names)
+        range_sizes = uppers - lowers
+        
+        min_vals = lowers + min_vals_norm * range_sizes
+        max_vals = lowers + max_vals_norm * range_sizes
+        min_vals, max_vals = self._clamp_range_bounds_vec(
+            min_vals, max_vals,
+            lowers + col_min * range_sizes, lowers + col_max * range_sizes,
+            lowers, uppers
+        )
+        
         compressed_ranges = {}
         for i, param_name in enumerate(numeric_param_names):
             if param_name in fixed_params:
                 logger.debug(f"Skipping range compression for fixed parameter '{param_name}'")
                 continue
-            values_norm = X_combined[:, i]
-            
-            mean = np.mean(values_norm)
-            std = np.std(values_norm)
-            min_val_norm = max(np.min(values_norm), mean - self.sigma * std)
-            max_val_norm = min(np.max(values_norm), mean + self.sigma * std)
-            
-            hp = original_space.get_hyperparameter(param_name)
-            lower = hp.lower
-            upper = hp.upper
-            range_size = upper - lower
-            
-            min_val = lower + min_val_norm * range_size
-            max_val = lower + max_val_norm * range_size
-            
-            values_original = lower + values_norm * range_size
-            
-            min_val, max_val = self._clamp_range_bounds(
-                min_val, max_val, values_original, original_space, param_name
-            )
             
-            compressed_ranges[param_name] = (min_val, max_val)
+            compressed_ranges[param_name] = (min_vals[i], max_vals[i])
         
         return compressed_ranges
     
@@ -2,7 +2,6 @@
 Expert-specified range compression step.
 """
 
-import copy
 from typing import Optional, List, Dict, Tuple
 from openbox.utils.history import History
 from ConfigSpace import ConfigurationSpace
@@ -33,15 +32,16 @@ class ExpertRangeStep(RangeCompressionStep):
                                   source_similarities: Optional[Dict[int, float]] = None) -> ConfigurationSpace:
         if not self.expert_ranges:
             logger.warning("No expert ranges provided, returning input space")
-            return copy.deepcopy(input_space)
+            return input_space
         
         valid_ranges = {}
-        param_names = input_space.get_hyperparameter_names()
+        hp_map = {hp.name: hp for hp in input_space.get_hyperparameters()}
         
         fixed_params = self._get_fixed_params()
         
         for param_name, (min_val, max_val) in self.expert_ranges.items():
-            if param_name not in param_names:
+            hp = hp_map.get(param_name)
+            if hp is None:
                 logger.warning(f"Expert parameter '{param_name}' not found in configuration space")
                 continue
             if param_name in fixed_params:
@@ -52,7 +52,6 @@ class ExpertRangeStep(RangeCompressionStep):
                 logger.warning(f"Invalid expert range [{min_val}, {max_val}] for {param_name}, skipping")
                 continue
             
-            hp = input_space.get_hyperparameter(param_name)
             if not (hasattr(hp, 'lower') and hasattr(hp, 'upper')):
                 logger.warning(f"Parameter '{param_name}' is not numeric, skipping")
                 continue
@@ -69,7 +68,7 @@ class ExpertRangeStep(RangeCompressionStep):
         
         if not valid_ranges:
             logger.warning("No valid expert ranges, returning input space")
-            return copy.deepcopy(input_space)
+            return input_space
         
         compressed_space = create_space_from_ranges(input_space, valid_ranges)
         logger.info(f"Expert range compression: {len(valid_ranges)} parameters compressed")
@@ -1,4 +1,3 @@
-import copy
 import numpy as np
 from typing import Optional, List, Tuple, Dict
 from openbox.utils.history import History
@@ -41,13 +40,13 @@ class KDEBoundaryRangeStep(BoundaryRangeStep):
                                 source_similarities: Optional[Dict[int, float]] = None) -> ConfigurationSpace:
         if not space_history:
             logger.warning("No space history provided for KDE boundary compression, returning input space")
-            return copy.deepcopy(input_space)
+            return input_space
 
         numeric_param_names, _ = extract_numeric_hyperparameters(input_space)
         
         if not numeric_param_names:
             logger.warning("No numeric hyperparameters found, returning input space")
-            return copy.deepcopy(input_space)
+            return input_space
         
         compressed_ranges = self._compute_kde_based_ranges(
             space_history, numeric_param_names, input_space, source_similarities
@@ -168,7 +167,7 @@ class KDEBoundaryRangeStep(BoundaryRangeStep):
             max_val = np.max(selected_grid)
             
             min_val, max_val = self._clamp_range_bounds(
-                min_val, max_val, weighted_values, original_space, param_name
+                min_val, max_val, weighted_values, original_min, original_max
             )
             
             compressed_ranges[param_name] = (min_val, max_val)
@@ -8,6 +8,8 @@ from ConfigSpace import ConfigurationSpace, Configuration
 from ConfigSpace.hyperparameters import UniformIntegerHyperparameter, UniformFloatHyperparameter
 from openbox import space as sp, logger as _logger
 
+from .space_cache import SpaceCache
+
 def create_param(key, value):
     q_val = value.get('q', None)
     param_type = value['type']
@@ -139,11 +141,15 @@ def extract_top_samples_from_history(
     input_space: ConfigurationSpace,
     top_ratio: float = 1.0,
     normalize: bool = True,
-    return_history_indices: bool = False
+    return_history_indices: bool = False,
+    stacked: bool = False
 ) -> Union[Tuple[List[np.ndarray], List[np.ndarray]], Tuple[List[np.ndarray], List[np.ndarray], List[int]]]:
-    all_x = []
-    all_y = []
-    history_indices = [] if return_history_indices else None
+    """
+    With ``stacked=True`` the samples of all histories are written straight into
+    one (n_samples, n_params) matrix and one objective vector instead of being
+    returned per history; history indices are then returned as an array.
+    """
+    selected = []
     
     for task_idx, history in enumerate(space_history):
         if len(history) == 0:
@@ -163,25 +169,51 @@ def extract_top_samples_from_history(
             _logger.debug(f"Skipping history with no valid objectives")
             continue
         
-        x_numeric = extract_numeric_values_from_configs(
-            valid_configs, numeric_param_names, input_space, normalize=normalize
-        )
-        
         objectives_array = np.array(valid_objectives)
         
         if top_ratio < 1.0:
-            sorted_indices = np.argsort(objectives_array)
-            top_n = max(1, int(len(sorted_indices) * top_ratio))
-            top_indices = sorted_indices[: top_n]
-            all_x.append(x_numeric[top_indices])
-            all_y.append(objectives_array[top_indices])
-            if return_history_indices:
-                history_indices.extend([task_idx] * len(top_indices))
-        else:
-            all_x.append(x_numeric)
-            all_y.append(objectives_array)
-            if return_history_indices:
-                history_indices.extend([task_idx] * len(x_numeric))
+            # Select the top configs before extracting, so only they are converted;
+            # argpartition finds them in O(n) and only the kept head is sorted
+            top_n = max(1, int(len(objectives_array) * top_ratio))
+            if top_n < len(objectives_array):
+                top_indices = np.argpartition(objectives_array, top_n - 1)[: top_n]
+                top_indices = top_indices[np.argsort(objectives_array[top_indices])]
+            else:
+                top_indices = np.argsort(objectives_array)
+            valid_configs = [valid_configs[i] for i in top_indices]
+            objectives_array = objectives_array[top_indices]
+        
+        selected.append((task_idx, valid_configs, objectives_array))
+    
+    if stacked:
+        n_total = sum(len(configs) for _, configs, _ in selected)
+        X = np.empty((n_total, len(numeric_param_names)))
+        offset = 0
+        for _, configs, _ in selected:
+            extract_numeric_values_from_configs(
+                configs, numeric_param_names, input_space, normalize=normalize,
+                out=X[offset: offset + len(configs)]
+            )
+            offset += len(configs)
+        y = np.concatenate([objectives for _, _, objectives in selected]) if selected else np.empty(0)
+        if return_history_indices:
+            history_indices = np.repeat(
+                np.array([task_idx for task_idx, _, _ in selected], dtype=int),
+                [len(configs) for _, configs, _ in selected]
+            )
+            return X, y, history_indices
+        return X, y
+    
+    all_x = []
+    all_y = []
+    history_indices = [] if return_history_indices else None
+    for task_idx, configs, objectives in selected:
+        all_x.append(extract_numeric_values_from_configs(
+            configs, numeric_param_names, input_space, normalize=normalize
+        ))
+        all_y.append(objectives)
+        if return_history_indices:
+            history_indices.extend([task_idx] * len(configs))
     
     return (all_x, all_y, history_indices) if return_history_indices else (all_x, all_y)
 
@@ -190,11 +222,16 @@ def extract_numeric_values_from_configs(
     configs: List[Union[Configuration, Dict]],
     numeric_param_names: List[str],
     input_space: ConfigurationSpace,
-    normalize: bool = True
+    normalize: bool = True,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     n_samples = len(configs)
     n_params = len(numeric_param_names)
-    X = np.zeros((n_samples, n_params))
+    if out is None:
+        X = np.zeros((n_samples, n_params))
+    else:
+        X = out
+        X[:] = 0.0
     
     for i, param_name in enumerate(numeric_param_names):
         try:
@@ -281,11 +318,19 @@ def collect_compression_details(original_space: ConfigurationSpace, compressed_s
     return details
 
 
-def extract_numeric_hyperparameters(space: ConfigurationSpace) -> Tuple[List[str], List[int]]:
+_NUMERIC_CACHE = SpaceCache()
+
+
+def _numeric_hyperparameters(space: ConfigurationSpace) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
     numeric_hyperparameter_indices = []
     numeric_hyperparameter_names = []
     for i, hp in enumerate(space.get_hyperparameters()):
         if hasattr(hp, 'lower') and hasattr(hp, 'upper'):
             numeric_hyperparameter_names.append(hp.name)
             numeric_hyperparameter_indices.append(i)
-    return numeric_hyperparameter_names, numeric_hyperparameter_indices
\ No newline at end of file
+    return tuple(numeric_hyperparameter_names), tuple(numeric_hyperparameter_indices)
+
+
+def extract_numeric_hyperparameters(space: ConfigurationSpace) -> Tuple[List[str], List[int]]:
+    names, indices = _NUMERIC_CACHE.get(space, _numeric_hyperparameters)
+    return list(names), list(indices)
\ No newline at end of file
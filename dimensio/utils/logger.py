@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import sys
 from typing import Optional
 
@@ -36,17 +37,20 @@ def setup_logging(
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
     
+    formatter = logging.Formatter(format_string)
+    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(logging.Formatter(format_string))
+    console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
-    # Optional file handler
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
+    # Optional file handler; worker processes leave the file to the main process,
+    # and the file is only opened on the first emitted record
+    if log_file and multiprocessing.current_process().name == 'MainProcess':
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(level)
-        file_handler.setFormatter(logging.Formatter(format_string))
+        file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
     # Prevent propagation to root logger
@@ -63,4 +67,6 @@ def enable_logging():
     logger.disabled = False
 
 
-setup_logging()
\ No newline at end of file
+# Configure once: re-importing in forked workers keeps the inherited handlers
+if not logging.getLogger('compressor').handlers:
+    setup_logging()
\ No newline at end of file
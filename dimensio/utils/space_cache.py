@@ -0,0 +1,39 @@
+import weakref
+from typing import Any, Callable, Dict, Tuple
+from ConfigSpace import ConfigurationSpace
+
+
+class SpaceCache:
+    """
+    Memoize values derived from a ConfigurationSpace, keyed on the space's identity.
+
+    Entries are dropped when their space is garbage collected, and recomputed
+    when hyperparameters have been added to the space since they were cached.
+    Spaces that cannot be weakly referenced are computed every time.
+    """
+
+    def __init__(self):
+        # id(space) -> (weakref to space, number of hyperparameters, value)
+        self._entries: Dict[int, Tuple[weakref.ref, int, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, space: ConfigurationSpace, compute: Callable[[ConfigurationSpace], Any]) -> Any:
+        key = id(space)
+        n_hps = len(space)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is space and entry[1] == n_hps:
+            return entry[2]
+
+        value = compute(space)
+        entries = self._entries
+        try:
+            ref = weakref.ref(space, lambda _, key=key: entries.pop(key, None))
+        except TypeError:
+            return value
+        entries[key] = (ref, n_hps, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
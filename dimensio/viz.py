@@ -1,27 +1,67 @@
+import os
+import sys
 import numpy as np
+import matplotlib
+# Only default to Agg when the caller has not picked a backend or imported pyplot
+if ('matplotlib.pyplot' not in sys.modules and not os.environ.get('MPLBACKEND')
+        and not os.environ.get('DIMENSIO_VIZ_INTERACTIVE')):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import List, Dict, Tuple, Optional
 from ConfigSpace import ConfigurationSpace
 import json
-import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from openbox import logger
 
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+DEFAULT_DPI = int(os.environ.get('DIMENSIO_VIZ_DPI', '100'))
+
+_mpl_configured = False
 
 
-def visualize_range_compression_step(step, step_index: int, save_dir: str):    
-    if not (hasattr(step, 'compression_info') and step.compression_info):
+def _ensure_mpl_configured():
+    """Import seaborn and apply the plot style on first use."""
+    global _mpl_configured
+    if _mpl_configured:
         return
-    
-    info = step.compression_info
-    if 'compressed_params' not in info or len(info['compressed_params']) == 0:
+    import seaborn as sns
+    sns.set_style("whitegrid")
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+    _mpl_configured = True
+
+
+def _savefig(fig: plt.Figure, save_path: str, dpi: Optional[int] = None):
+    kwargs = {}
+    if save_path.lower().endswith('.png'):
+        # Fast zlib level; these are diagnostic plots, not archival images
+        kwargs['pil_kwargs'] = {'compress_level': 1}
+    fig.savefig(save_path, dpi=dpi or DEFAULT_DPI, **kwargs)
+
+
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, in ascending order of value."""
+    if k <= 0 or k >= len(values):
+        return np.argsort(values)
+    head = np.argpartition(values, -k)[-k:]
+    return head[np.argsort(values[head])]
+
+
+def _has_range_compression(step) -> bool:
+    info = getattr(step, 'compression_info', None)
+    return bool(info) and len(info.get('compressed_params', ())) > 0
+
+
+def visualize_range_compression_step(step, step_index: int, save_dir: str, dpi: Optional[int] = None,
+                                     fig: Optional[plt.Figure] = None, fmt: str = 'png'):
+    if not _has_range_compression(step):
         return
-    
-    fig = plt.figure(figsize=(14, max(8, len(info['compressed_params']) * 0.4)))
-    
+    _render_step_plot(step.name, step.compression_info, step_index, save_dir, dpi, fig, fmt)
+
+
+def _render_step_plot(step_name: str, info: dict, step_index: int, save_dir: str,
+                      dpi: Optional[int] = None, fig: Optional[plt.Figure] = None, fmt: str = 'png'):
+    _ensure_mpl_configured()
     compressed_params = info['compressed_params']
     n_params = len(compressed_params)
     
@@ -29,7 +69,7 @@ def visualize_range_compression_step(step, step_index: int, save_dir: str):
         compressed_params = compressed_params[:30]
         n_params = 30
     
-    param_names = [p['name'].split('.')[-1] for p in compressed_params]
+    param_names = [p['name'].rsplit('.', 1)[-1] for p in compressed_params]
     
     original_ranges = []
     compressed_ranges = []
@@ -48,44 +88,48 @@ def visualize_range_compression_step(step, step_index: int, save_dir: str):
             else:
                 param_labels.append('')
     
-    y_pos = np.arange(n_params)
-    ax = plt.subplot(111)
+    if not original_ranges:
+        return
+    if not any(param_labels) and all(tuple(o[:2]) == tuple(c[:2]) for o, c in zip(original_ranges, compressed_ranges)):
+        logger.info("Skipping range compression plot for %s: no range was narrowed", step_name)
+        return
+    
+    height = max(8, len(info['compressed_params']) * 0.4)
+    owns_fig = fig is None
+    if owns_fig:
+        fig = plt.figure(figsize=(14, height))
+    else:
+        fig.clf()
+        fig.set_size_inches(14, height)
     
-    for idx, (orig, comp, name, label) in enumerate(zip(original_ranges, compressed_ranges, param_names, param_labels)):
+    y_pos = np.arange(n_params)
+    ax = fig.add_subplot(111)
+    
+    n_rows = len(original_ranges)
+    orig = np.asarray(original_ranges, dtype=float)[:, :2]
+    comp = np.asarray(compressed_ranges, dtype=float)[:, :2]
+    is_quant = np.array([label != '' for label in param_labels])
+    span = orig[:, 1] - orig[:, 0]
+    rescale = ~is_quant & (span > 0)
+    denom = np.where(rescale, span, 1.0)
+    comp_start = np.where(rescale, (comp[:, 0] - orig[:, 0]) / denom, 0.0)
+    comp_end = np.where(rescale, (comp[:, 1] - orig[:, 0]) / denom, 1.0)
+    colors = plt.cm.RdYlGn_r(np.asarray(compression_ratios, dtype=float))
+    rows = np.arange(n_rows)
+    
+    ax.barh(rows, 1.0, left=0.0, height=0.4, alpha=0.3, color='gray', label='Original')
+    if is_quant.any():
+        ax.barh(rows[is_quant], (comp_end - comp_start)[is_quant], left=comp_start[is_quant], height=0.4,
+               alpha=0.5, color=colors[is_quant], edgecolor=colors[is_quant], linewidth=2, linestyle='--',
+               label='Quantized (mapped)' if is_quant[0] else '')
+    if not is_quant.all():
+        ax.barh(rows[~is_quant], (comp_end - comp_start)[~is_quant], left=comp_start[~is_quant], height=0.4,
+               alpha=0.8, color=colors[~is_quant], label='Compressed' if not is_quant[0] else '')
+    
+    for idx, (orig, comp, label) in enumerate(zip(original_ranges, compressed_ranges, param_labels)):
         orig_min, orig_max = orig[0], orig[1]
         comp_min, comp_max = comp[0], comp[1]
-        
-        norm_orig_start = 0.0
-        norm_orig_end = 1.0
-        
-        is_quantization = label != ''
-        
-        if is_quantization:
-            norm_comp_start = 0.0
-            norm_comp_end = 1.0
-            edge_style = 'dashed'
-        else:
-            if orig_max - orig_min > 0:
-                norm_comp_start = (comp_min - orig_min) / (orig_max - orig_min)
-                norm_comp_end = (comp_max - orig_min) / (orig_max - orig_min)
-            else:
-                norm_comp_start = 0.0
-                norm_comp_end = 1.0
-            edge_style = 'solid'
-        
-        ax.barh(idx, norm_orig_end - norm_orig_start, left=norm_orig_start, height=0.4, 
-               alpha=0.3, color='gray', label='Original' if idx == 0 else '')
-        
         ratio = compression_ratios[idx]
-        color = plt.cm.RdYlGn_r(ratio)
-        
-        if is_quantization:
-            ax.barh(idx, norm_comp_end - norm_comp_start, left=norm_comp_start, height=0.4,
-                   alpha=0.5, color=color, edgecolor=color, linewidth=2, linestyle='--',
-                   label='Quantized (mapped)' if idx == 0 and label else '')
-        else:
-            ax.barh(idx, norm_comp_end - norm_comp_start, left=norm_comp_start, height=0.4,
-                   alpha=0.8, color=color, label='Compressed' if idx == 0 and not label else '')
         
         if label:
             ax.text(1.02, idx, f'{ratio:.1%} ({label})', va='center', fontsize=7)
@@ -107,26 +151,29 @@ def visualize_range_compression_step(step, step_index: int, save_dir: str):
     ax.set_yticklabels(param_names, fontsize=9)
     ax.set_xlim(-0.15, 1.25)
     ax.set_xlabel('Normalized Range [0=lower, 1=upper]', fontsize=12, fontweight='bold')
-    ax.set_title(f'{step.name}: Range Compression Details (Top {n_params} params)', 
+    ax.set_title(f'{step_name}: Range Compression Details (Top {n_params} params)', 
                fontsize=14, fontweight='bold', pad=20)
     ax.legend(loc='upper right')
     ax.grid(axis='x', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(save_dir, f'range_compression_step_{step_index}.png'), 
-               dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"  Saved range_compression_step_{step_index}.png")
+    fig.tight_layout()
+    save_path = os.path.join(save_dir, f'range_compression_step_{step_index}.{fmt}')
+    _savefig(fig, save_path, dpi)
+    if owns_fig:
+        plt.close(fig)
+    logger.info("Saved %s", save_path)
 
 
-def visualize_compression_summary(pipeline, save_path: str):
+def visualize_compression_summary(pipeline, save_path: str, dpi: Optional[int] = None):
     """
     Generate a 4-panel compression summary visualization.
     
     Args:
         pipeline: CompressionPipeline with compression steps
         save_path: Path to save the summary plot
+        dpi: Output resolution, defaults to DEFAULT_DPI
     """
+    _ensure_mpl_configured()
     
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
@@ -210,9 +257,10 @@ def visualize_compression_summary(pipeline, save_path: str):
     
     summary_text = "Compression Summary\n" + "="*40 + "\n\n"
     summary_text += f"Original dimensions: {dimensions[0]}\n"
+    surrogate_dim = len(pipeline.surrogate_space.get_hyperparameters())
     summary_text += f"Final sample space: {len(pipeline.sample_space.get_hyperparameters())}\n"
-    summary_text += f"Final surrogate space: {len(pipeline.surrogate_space.get_hyperparameters())}\n"
-    summary_text += f"Overall compression: {len(pipeline.surrogate_space.get_hyperparameters())/dimensions[0]:.1%}\n\n"
+    summary_text += f"Final surrogate space: {surrogate_dim}\n"
+    summary_text += f"Overall compression: {surrogate_dim/dimensions[0]:.1%}\n\n"
     
     summary_text += "Steps:\n"
     for i, step in enumerate(pipeline.steps):
@@ -238,12 +286,13 @@ def visualize_compression_summary(pipeline, save_path: str):
            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _savefig(fig, save_path, dpi)
     plt.close()
-    print(f"  Saved compression_summary.png")
+    logger.info("Saved %s", save_path)
 
 
-def visualize_compression_details(compressor, save_dir: str):
+def visualize_compression_details(compressor, save_dir: str, dpi: Optional[int] = None, n_jobs: int = 1,
+                                  fmt: str = 'png'):
     """
     Intelligently visualize compression details based on the steps used.
     
@@ -261,7 +310,12 @@ def visualize_compression_details(compressor, save_dir: str):
     - Multi-task importance heatmap (if multiple source tasks are used)
     - Dimension evolution (if adaptive dimension step with history is used)
     - Source task similarities (if transfer learning is used)
+    
+    With n_jobs > 1 the per-step range compression plots are rendered in
+    worker processes (-1 uses all cores). fmt selects the output file format
+    (e.g. 'png', 'svg', 'pdf'); vector formats skip rasterization entirely.
     """
+    _ensure_mpl_configured()
     os.makedirs(save_dir, exist_ok=True)
     
     pipeline = compressor.pipeline
@@ -272,16 +326,34 @@ def visualize_compression_details(compressor, save_dir: str):
     # 1. Generate compression summary (always)
     visualize_compression_summary(
         pipeline=pipeline,
-        save_path=os.path.join(save_dir, 'compression_summary.png')
+        save_path=os.path.join(save_dir, f'compression_summary.{fmt}'),
+        dpi=dpi
     )
     
     # 2. Generate range compression details for each step
-    for i, step in enumerate(pipeline.steps):
-        visualize_range_compression_step(
-            step=step,
-            step_index=i+1,
-            save_dir=save_dir
-        )
+    range_steps = [(i + 1, step) for i, step in enumerate(pipeline.steps) if _has_range_compression(step)]
+    if n_jobs != 1 and len(range_steps) > 1:
+        max_workers = min(len(range_steps), os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_render_step_plot,
+                              [step.name for _, step in range_steps],
+                              [step.compression_info for _, step in range_steps],
+                              [idx for idx, _ in range_steps],
+                              repeat(save_dir), repeat(dpi), repeat(None), repeat(fmt)))
+    elif range_steps:
+        step_fig = plt.figure()
+        try:
+            for idx, step in range_steps:
+                visualize_range_compression_step(
+                    step=step,
+                    step_index=idx,
+                    save_dir=save_dir,
+                    dpi=dpi,
+                    fig=step_fig,
+                    fmt=fmt
+                )
+        finally:
+            plt.close(step_fig)
     
     # Intelligent visualization based on step types
     
@@ -290,7 +362,8 @@ def visualize_compression_details(compressor, save_dir: str):
         try:
             visualize_source_task_similarities(
                 similarities=compressor._source_similarities,
-                save_path=os.path.join(save_dir, 'source_task_similarities.png')
+                save_path=os.path.join(save_dir, f'source_task_similarities.{fmt}'),
+                dpi=dpi
             )
         except Exception as e:
             logger.warning(f"Failed to generate source task similarity plot: {e}")
@@ -314,8 +387,9 @@ def visualize_compression_details(compressor, save_dir: str):
                                 visualize_parameter_importance(
                                     param_names=param_names,
                                     importances=importances,
-                                    save_path=os.path.join(save_dir, f'parameter_importance_step_{i+1}.png'),
-                                    topk=min(20, len(param_names))
+                                    save_path=os.path.join(save_dir, f'parameter_importance_step_{i+1}.{fmt}'),
+                                    topk=min(20, len(param_names)),
+                                    dpi=dpi
                                 )
                             except Exception as e:
                                 logger.warning(f"Failed to generate parameter importance plot: {e}")
@@ -327,8 +401,9 @@ def visualize_compression_details(compressor, save_dir: str):
                                     visualize_importance_heatmap(
                                         param_names=param_names,
                                         importances=cache['importances_per_task'],
-                                        save_path=os.path.join(save_dir, f'multi_task_importance_heatmap_step_{i+1}.png'),
-                                        tasks=cache['task_names']
+                                        save_path=os.path.join(save_dir, f'multi_task_importance_heatmap_step_{i+1}.{fmt}'),
+                                        tasks=cache['task_names'],
+                                        dpi=dpi
                                     )
                                 except Exception as e:
                                     logger.warning(f"Failed to generate multi-task importance heatmap: {e}")
@@ -344,16 +419,19 @@ def visualize_compression_details(compressor, save_dir: str):
                         visualize_adaptive_dimension_evolution(
                             iterations=iterations,
                             dimensions=dimensions,
-                            save_path=os.path.join(save_dir, 'dimension_evolution.png'),
-                            title='Adaptive Dimension Evolution'
+                            save_path=os.path.join(save_dir, f'dimension_evolution.{fmt}'),
+                            title='Adaptive Dimension Evolution',
+                            dpi=dpi
                         )
                     except Exception as e:
                         logger.warning(f"Failed to generate dimension evolution plot: {e}")
 
 
-def visualize_parameter_importance(param_names: List[str], importances: List[float], save_path: str, topk: int = 20):
+def visualize_parameter_importance(param_names: List[str], importances: List[float], save_path: str, topk: int = 20,
+                                   dpi: Optional[int] = None):
+    _ensure_mpl_configured()
     abs_importances = np.abs(importances)
-    sorted_indices = np.argsort(abs_importances)[-topk:]
+    sorted_indices = _top_k_indices(abs_importances, topk)
     top_names = [param_names[i] for i in sorted_indices]
     top_importances = [abs_importances[i] for i in sorted_indices]
     
@@ -375,13 +453,15 @@ def visualize_parameter_importance(param_names: List[str], importances: List[flo
                 ha='left', va='center', fontsize=9)
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _savefig(fig, save_path, dpi)
     plt.close()
-    print(f"Saved parameter importance plot to {save_path}")
+    logger.info("Saved parameter importance plot to %s", save_path)
 
 
 def visualize_adaptive_dimension_evolution(iterations: List[int], dimensions: List[int], 
-                                          save_path: str, title: str = 'Adaptive Dimension Evolution'):
+                                          save_path: str, title: str = 'Adaptive Dimension Evolution',
+                                          dpi: Optional[int] = None):
+    _ensure_mpl_configured()
     fig, ax = plt.subplots(figsize=(10, 6))
     
     ax.plot(iterations, dimensions, marker='o', linewidth=2, markersize=8, 
@@ -412,14 +492,16 @@ def visualize_adaptive_dimension_evolution(iterations: List[int], dimensions: Li
         ax.set_ylim([min(dimensions) - 0.5, max(dimensions) + 0.5])
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _savefig(fig, save_path, dpi)
     plt.close()
-    print(f"Saved adaptive dimension evolution plot to {save_path}")
+    logger.info("Saved adaptive dimension evolution plot to %s", save_path)
 
 
 def visualize_source_task_similarities(similarities: Dict[int, float], 
                                        save_path: str,
-                                       task_names: Optional[List[str]] = None):    
+                                       task_names: Optional[List[str]] = None,
+                                       dpi: Optional[int] = None):    
+    _ensure_mpl_configured()
     if not similarities:
         return
     
@@ -450,13 +532,15 @@ def visualize_source_task_similarities(similarities: Dict[int, float],
     ax.grid(axis='y', alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _savefig(fig, save_path, dpi)
     plt.close()
-    print(f"  Saved source_task_similarities.png")
+    logger.info("Saved %s", save_path)
 
 
 def visualize_importance_heatmap(param_names: List[str], importances: np.ndarray, 
-                                 save_path: str, tasks: Optional[List[str]] = None):    
+                                 save_path: str, tasks: Optional[List[str]] = None,
+                                 dpi: Optional[int] = None):    
+    _ensure_mpl_configured()
     if len(importances.shape) == 1:
         importances = importances.reshape(1, -1)
     
@@ -469,12 +553,12 @@ def visualize_importance_heatmap(param_names: List[str], importances: np.ndarray
     
     if n_params > 30:
         mean_importance = importances.mean(axis=0)
-        top_indices = np.argsort(mean_importance)[-30:]
+        top_indices = _top_k_indices(mean_importance, 30)
         importances = importances[:, top_indices]
         param_names = [param_names[i] for i in top_indices]
         n_params = 30
     
-    short_names = [name.split('.')[-1] if len(name) > 20 else name for name in param_names]
+    short_names = [name.rsplit('.', 1)[-1] if len(name) > 20 else name for name in param_names]
     
     fig, ax = plt.subplots(figsize=(max(14, n_params * 0.5), max(8, n_tasks * 0.6)))
     
@@ -489,25 +573,30 @@ def visualize_importance_heatmap(param_names: List[str], importances: np.ndarray
     # Option 3: 'plasma' - Dark blue (low) -> Purple -> Orange -> Yellow (high) [Good contrast]
     # Option 4: 'rocket_r' - Black (low) -> Red -> Orange (high) [High contrast]
     # Option 5: 'mako_r' - Teal (low) -> Green -> Yellow (high) [Cool tones]
-    cmap = sns.color_palette("RdYlGn_r", as_cmap=True)
+    cmap = plt.get_cmap("RdYlGn_r")
     
     show_annotations = (n_tasks <= 5 and n_params <= 20)
     
-    sns.heatmap(normalized_importances, 
-                annot=show_annotations,
-                fmt='.2f' if show_annotations else '',
-                cmap=cmap,
-                xticklabels=short_names, 
-                yticklabels=tasks,
-                cbar_kws={
-                    'label': 'Normalized Importance Score',
-                    'orientation': 'vertical',
-                    'pad': 0.02
-                },
-                linewidths=0.5,
-                linecolor='white',
-                square=False,
-                ax=ax)
+    mesh = ax.pcolormesh(normalized_importances, cmap=cmap, edgecolors='white', linewidth=0.5)
+    ax.set_xlim(0, n_params)
+    ax.set_ylim(n_tasks, 0)
+    ax.set_xticks(np.arange(n_params) + 0.5)
+    ax.set_xticklabels(short_names)
+    ax.set_yticks(np.arange(n_tasks) + 0.5)
+    ax.set_yticklabels(tasks, va='center')
+    ax.grid(False)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    cbar = fig.colorbar(mesh, ax=ax, label='Normalized Importance Score', orientation='vertical', pad=0.02)
+    cbar.outline.set_linewidth(0)
+    
+    if show_annotations:
+        rgb = mesh.cmap(mesh.norm(normalized_importances))[..., :3]
+        rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        luminance = rgb @ np.array([0.2126, 0.7152, 0.0722])
+        for (row, col), value in np.ndenumerate(normalized_importances):
+            ax.text(col + 0.5, row + 0.5, f'{value:.2f}', ha='center', va='center',
+                   color='.15' if luminance[row, col] > 0.408 else 'white')
     
     ax.set_xlabel('Parameters', fontsize=13, fontweight='bold', labelpad=10)
     ax.set_ylabel('Tasks', fontsize=13, fontweight='bold', labelpad=10)
@@ -520,7 +609,7 @@ def visualize_importance_heatmap(param_names: List[str], importances: np.ndarray
     ax.set_facecolor('#f0f0f0')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    _savefig(fig, save_path, dpi)
     plt.close()
     
-    print(f"  Saved multi_task_importance_heatmap.png")
+    logger.info("Saved %s", save_path)
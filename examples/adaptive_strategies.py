@@ -6,6 +6,9 @@ Demonstrates different update strategies for adaptive dimension selection:
 2. Stagnation Detection Strategy
 3. Improvement Detection Strategy
 4. Composite Strategy (Stagnation + Improvement)
+
+Set DIMENSIO_VIZ=0 to skip the matplotlib visualizations (e.g. when timing
+the example); they are generated by default.
 """
 import os
 
@@ -26,6 +29,7 @@ from dimensio.viz import visualize_compression_details
 from utils import create_simple_config_space, generate_history, generate_improving_history
 
 res_dir = "./results/adaptive_strategies"
+VIZ_ENABLED = os.environ.get('DIMENSIO_VIZ', '1') == '1'
 
 def run_adaptive_with_strategy(config_space, strategy, strategy_name, n_iterations=15):
     print(f"\n{'='*80}")
@@ -119,10 +123,11 @@ def run_adaptive_with_strategy(config_space, strategy, strategy_name, n_iteratio
     print(f"\nFinal dimensions: {dimension_history[-1]}")
     print(f"Total updates: {sum(1 for i in range(1, len(dimension_history)) if dimension_history[i] != dimension_history[i-1])}")
     
-    output_dir = f'{res_dir}/{strategy_folder}/viz'
-    os.makedirs(output_dir, exist_ok=True)
-    
-    visualize_compression_details(compressor, save_dir=output_dir)
+    if VIZ_ENABLED:
+        output_dir = f'{res_dir}/{strategy_folder}/viz'
+        os.makedirs(output_dir, exist_ok=True)
+        
+        visualize_compression_details(compressor, save_dir=output_dir)
     
     iterations = compressor._iteration_history
     dimension_history = compressor._dimension_history
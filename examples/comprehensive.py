@@ -6,6 +6,9 @@ Demonstrates:
 2. Generating mock history data
 3. Using different compression step combinations
 4. Visualizing compression effects
+
+Set DIMENSIO_VIZ=0 to skip the matplotlib visualizations (e.g. when timing
+the examples); they are generated by default.
 """
 
 import numpy as np
@@ -35,6 +38,7 @@ from dimensio.viz import visualize_compression_details
 from utils import generate_mock_history
 
 res_dir = "./results/comprehensive"
+VIZ_ENABLED = os.environ.get('DIMENSIO_VIZ', '1') == '1'
 
 
 def create_sample_config_space():
@@ -95,15 +99,16 @@ def spark_objective(config_dict):
     return max(score, 10.0)
 
 
-def example_1_shap_dimension_range():
+def example_1_shap_dimension_range(config_space=None, history=None):
     """Example 1: SHAP dimension selection + range compression."""
     print("\n" + "="*80)
     print("Example 1: SHAP Dimension Selection + Boundary Range Compression")
     print("="*80)
     
-    config_space = create_sample_config_space()
-    
-    history = generate_mock_history(config_space, n_samples=50, objective_func=spark_objective)
+    if config_space is None:
+        config_space = create_sample_config_space()
+    if history is None:
+        history = generate_mock_history(config_space, n_samples=50, objective_func=spark_objective)
     
     # Define compression steps
     steps = [
@@ -131,22 +136,25 @@ def example_1_shap_dimension_range():
     print(f"  - Compression ratio: {summary['surrogate_compression_ratio']:.2%}")
     
     # Visualization
-    print(f"\n🎨 Generating visualizations...")
-    visualize_compression_details(compressor, save_dir=f'{res_dir}/example1_shap_boundary/viz')
+    if VIZ_ENABLED:
+        print(f"\n🎨 Generating visualizations...")
+        visualize_compression_details(compressor, save_dir=f'{res_dir}/example1_shap_boundary/viz')
     
     print(f"✅ Example 1 complete! View results: {res_dir}/example1_shap_boundary/")
     
     return compressor
 
 
-def example_2_correlation_shap_range():
+def example_2_correlation_shap_range(config_space=None, history=None):
     """Example 2: Correlation dimension selection + SHAP range compression."""
     print("\n" + "="*80)
     print("Example 2: Correlation Dimension Selection + SHAP Weighted Range Compression")
     print("="*80)
     
-    config_space = create_sample_config_space()
-    history = generate_mock_history(config_space, n_samples=50, objective_func=spark_objective)
+    if config_space is None:
+        config_space = create_sample_config_space()
+    if history is None:
+        history = generate_mock_history(config_space, n_samples=50, objective_func=spark_objective)
     
     steps = [
         CorrelationDimensionStep(method='spearman', topk=5),
@@ -166,20 +174,22 @@ def example_2_correlation_shap_range():
     print(f"  - Originaldimensions: {len(config_space.get_hyperparameters())}")
     print(f"  - Compressed dimensions: {len(surrogate_space.get_hyperparameters())}")
     
-    visualize_compression_details(compressor, save_dir=f'{res_dir}/example2_correlation_shap/viz')
+    if VIZ_ENABLED:
+        visualize_compression_details(compressor, save_dir=f'{res_dir}/example2_correlation_shap/viz')
     
     print(f"✅ Example 2 complete！View results: {res_dir}/example2_correlation_shap/")
     
     return compressor
 
 
-def example_3_kde_range():
+def example_3_kde_range(config_space=None):
     """Example 3: Pure KDE range compression (no dimensionality reduction)."""
     print("\n" + "="*80)
     print("Example 3: KDE Range Compression (retain all dimensions)")
     print("="*80)
     
-    config_space = create_sample_config_space()
+    if config_space is None:
+        config_space = create_sample_config_space()
     history = generate_mock_history(config_space, n_samples=60, objective_func=spark_objective)
     
     steps = [
@@ -203,20 +213,22 @@ def example_3_kde_range():
     print(f"  - Originaldimensions: {len(config_space.get_hyperparameters())} (unchanged)")
     print(f"  - rangeCompressionratio: {steps[0].kde_coverage:.0%}")
     
-    visualize_compression_details(compressor, save_dir=f'{res_dir}/example3_kde/viz')
+    if VIZ_ENABLED:
+        visualize_compression_details(compressor, save_dir=f'{res_dir}/example3_kde/viz')
     
     print(f"✅ Example 3 complete！View results: {res_dir}/example3_kde/")
     
     return compressor
 
 
-def example_4_quantization_projection():
+def example_4_quantization_projection(config_space=None):
     """Example 4: Quantization + REMBO projection."""
     print("\n" + "="*80)
     print("Example 4: Quantization Projection + REMBO Low-dimensional Embedding")
     print("="*80)
     
-    config_space = create_sample_config_space()
+    if config_space is None:
+        config_space = create_sample_config_space()
     
     steps = [
         QuantizationProjectionStep(method='quantization', max_num_values=20),
@@ -245,20 +257,22 @@ def example_4_quantization_projection():
     unprojected_config = compressor.unproject_point(sample_config)
     print(f"  - Unprojected config: {list(unprojected_config.get_dictionary().keys())}")
     
-    visualize_compression_details(compressor, save_dir=f'{res_dir}/example4_quantization_rembo/viz')
+    if VIZ_ENABLED:
+        visualize_compression_details(compressor, save_dir=f'{res_dir}/example4_quantization_rembo/viz')
     
     print(f"✅ Example 4 complete！View results: {res_dir}/example4_quantization_rembo/")
     
     return compressor
 
 
-def example_5_expert_knowledge():
+def example_5_expert_knowledge(config_space=None):
     """Example 5: Expert knowledge (dimension selection + range specification)."""
     print("\n" + "="*80)
     print("Example 5: Expert Knowledge-based Compression")
     print("="*80)
     
-    config_space = create_sample_config_space()
+    if config_space is None:
+        config_space = create_sample_config_space()
     
     # Specify important parameters
     expert_params = [
@@ -294,20 +308,23 @@ def example_5_expert_knowledge():
     print(f"  - Expert selected dimensions: {len(expert_params)}")
     print(f"  - Compressed dimensions: {len(surrogate_space.get_hyperparameters())}")
     
-    visualize_compression_details(compressor, save_dir=f'{res_dir}/example5_expert/viz')
+    if VIZ_ENABLED:
+        visualize_compression_details(compressor, save_dir=f'{res_dir}/example5_expert/viz')
     
     print(f"✅ Example 5 complete！View results: {res_dir}/example5_expert/")
     
     return compressor
 
-def example_6_get_compressor_convenience():
+def example_6_get_compressor_convenience(config_space=None, history=None):
     """Example 6: Using convenience function get_compressor."""
     print("\n" + "="*80)
     print("Example 6: Using Convenience Function to Create Compressor Quickly")
     print("="*80)
     
-    config_space = create_sample_config_space()
-    history = generate_mock_history(config_space, n_samples=50, objective_func=spark_objective)
+    if config_space is None:
+        config_space = create_sample_config_space()
+    if history is None:
+        history = generate_mock_history(config_space, n_samples=50, objective_func=spark_objective)
     
     # Method 1: SHAP Strategy
     print(f"\n1️⃣ SHAP Strategy:")
@@ -354,13 +371,17 @@ def main():
     os.makedirs(res_dir, exist_ok=True)
     
     try:
+        # Examples 1, 2 and 6 use the same space and 50-sample history
+        config_space = create_sample_config_space()
+        history = generate_mock_history(config_space, n_samples=50, objective_func=spark_objective)
+        
         # Run allExample
-        example_1_shap_dimension_range()
-        example_2_correlation_shap_range()
-        example_3_kde_range()
-        example_4_quantization_projection()
-        example_5_expert_knowledge()
-        example_6_get_compressor_convenience()
+        example_1_shap_dimension_range(config_space, history)
+        example_2_correlation_shap_range(config_space, history)
+        example_3_kde_range(config_space)
+        example_4_quantization_projection(config_space)
+        example_5_expert_knowledge(config_space)
+        example_6_get_compressor_convenience(config_space, history)
         
         print(f"\n📁 View results directory: {res_dir}")
         
@@ -10,8 +10,12 @@ Scenario: Optimizing Spark configuration for different workload types
 - Source Task 2: Join workload (past optimization data)  
 - Source Task 3: Aggregate workload (past optimization data)
 - Target Task: Group-by workload (new task we want to optimize)
+
+Set DIMENSIO_VIZ=0 to skip the matplotlib visualizations (e.g. when timing
+the example); they are generated by default.
 """
 
+import os
 import numpy as np
 from ConfigSpace import ConfigurationSpace
 from openbox.utils.history import History
@@ -27,6 +31,7 @@ from dimensio.viz import visualize_compression_details
 from utils import create_spark_config_space, generate_mock_history
 
 res_dir = "./results/multiple_single_source"
+VIZ_ENABLED = os.environ.get('DIMENSIO_VIZ', '1') == '1'
 
 
 def objective_function(config: dict, workload_type: str) -> float:
@@ -105,8 +110,10 @@ def generate_workload_history(config_space: ConfigurationSpace,
         verbose=False  
     )
     
-    best_obj = min([obs.objectives[0] for obs in history.observations])
-    mean_obj = np.mean([obs.objectives[0] for obs in history.observations])
+    objectives = np.fromiter((obs.objectives[0] for obs in history.observations),
+                             dtype=np.float64, count=len(history.observations))
+    best_obj = objectives.min()
+    mean_obj = objectives.mean()
     print(f"    Best: {best_obj:.2f}, Mean: {mean_obj:.2f}")
     
     return history
@@ -254,16 +261,17 @@ def main():
     # ===============================================
     # Step 6: Visualize and compare
     # ===============================================
-    print(f"\n🎨 Step 6: Generating visualizations")
-    print("-" * 80)
-    
-    # Visualize multiple source tasks results
-    print("\n  Multiple Source Tasks compression:")
-    visualize_compression_details(compressor_multiple_source, save_dir=f'{res_dir}/multiple_source/viz')
-    
-    # Visualize single source task results
-    print("\n  Single Source Task compression:")
-    visualize_compression_details(compressor_single_source, save_dir=f'{res_dir}/single_source/viz')
+    if VIZ_ENABLED:
+        print(f"\n🎨 Step 6: Generating visualizations")
+        print("-" * 80)
+        
+        # Visualize multiple source tasks results
+        print("\n  Multiple Source Tasks compression:")
+        visualize_compression_details(compressor_multiple_source, save_dir=f'{res_dir}/multiple_source/viz')
+        
+        # Visualize single source task results
+        print("\n  Single Source Task compression:")
+        visualize_compression_details(compressor_single_source, save_dir=f'{res_dir}/single_source/viz')
     
     
     # ===============================================
@@ -276,9 +284,10 @@ def main():
     print(f"\n📊 Key results:")
     print(f"  - Source tasks: {len(source_histories)} (sort, join, aggregate)")
     print(f"  - Target task: group-by workload")
-    print(f"\n🎨 Visualizations saved to:")
-    print(f"  - {res_dir}/multiple_source/viz/")
-    print(f"  - {res_dir}/single_source/viz/")
+    if VIZ_ENABLED:
+        print(f"\n🎨 Visualizations saved to:")
+        print(f"  - {res_dir}/multiple_source/viz/")
+        print(f"  - {res_dir}/single_source/viz/")
     
     return compressor_multiple_source, compressor_single_source
 
@@ -2,8 +2,12 @@
 Dimensio Quick Start Example
 
 A simple example demonstrating basic usage.
+
+Set DIMENSIO_VIZ=0 to skip the matplotlib visualizations (e.g. when timing
+the example); they are generated by default.
 """
 
+import os
 import numpy as np
 from ConfigSpace import ConfigurationSpace
 from ConfigSpace.hyperparameters import UniformFloatHyperparameter, UniformIntegerHyperparameter
@@ -19,6 +23,7 @@ from dimensio import (
 from dimensio.viz import visualize_compression_details
 
 res_dir = "./results/quick_start"
+VIZ_ENABLED = os.environ.get('DIMENSIO_VIZ', '1') == '1'
 
 def create_simple_space():
     cs = ConfigurationSpace(seed=42)
@@ -52,9 +57,13 @@ def generate_simple_history(config_space, n_samples=30):
         score += np.random.normal(0, 2)  # Add noise
         return max(score, 1.0)
     
-    # Generate samples
-    for _ in range(n_samples):
-        config = config_space.sample_configuration()
+    # Generate samples (size=1 returns a single Configuration, not a list)
+    configs = config_space.sample_configuration(size=n_samples) if n_samples > 0 else []
+    if n_samples == 1:
+        configs = [configs]
+    
+    observations = []
+    for config in configs:
         obj_value = objective(config.get_dictionary())
         obs = Observation(
             config=config,
@@ -63,7 +72,8 @@ def generate_simple_history(config_space, n_samples=30):
             trial_state=SUCCESS,
             elapsed_time=0.1
         )
-        history.update_observation(obs)
+        observations.append(obs)
+    history.update_observations(observations)
     
     return history
 
@@ -79,9 +89,10 @@ def main():
     
     print("\n📊 Step 2: Generate mock history data")
     history = generate_simple_history(config_space, n_samples=30)
-    objectives = [obs.objectives[0] for obs in history.observations]
+    objectives = np.fromiter((obs.objectives[0] for obs in history.observations),
+                             dtype=np.float64, count=len(history.observations))
     print(f"   Generated {len(history.observations)} evaluation samples")
-    print(f"   Best: {min(objectives):.2f}, Mean: {np.mean(objectives):.2f}")
+    print(f"   Best: {objectives.min():.2f}, Mean: {objectives.mean():.2f}")
     
     print("\n🔧 Step 3: Create compressor using convenience function")
     compressor = get_compressor(
@@ -132,12 +143,13 @@ def main():
     print(f"\n📈 Custom compression results:")
     print(f"   Compressed dims: {len(surrogate_space_custom.get_hyperparameters())}")
     
-    print("\n🎨 Step 6: Generate visualizations")
-    visualize_compression_details(
-        compressor_custom,
-        save_dir=f'{res_dir}/viz'
-    )
-    print(f"   ✓ Visualizations saved to: {res_dir}/viz/")
+    if VIZ_ENABLED:
+        print("\n🎨 Step 6: Generate visualizations")
+        visualize_compression_details(
+            compressor_custom,
+            save_dir=f'{res_dir}/viz'
+        )
+        print(f"   ✓ Visualizations saved to: {res_dir}/viz/")
     
     print(f"\n✅ Done! Check {res_dir}/ for detailed results")
     print("="*60)
@@ -1,6 +1,8 @@
+import pickle
 import numpy as np
-from typing import Callable, Optional
-from ConfigSpace import ConfigurationSpace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+from ConfigSpace import ConfigurationSpace, Configuration
 from ConfigSpace.hyperparameters import (
     UniformIntegerHyperparameter,
     UniformFloatHyperparameter,
@@ -9,6 +11,14 @@ from ConfigSpace.hyperparameters import (
 from openbox.utils.history import History, Observation
 from openbox.utils.constants import SUCCESS
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+_RNG = np.random.default_rng()
+
 
 def create_simple_config_space(n_float: int = 5, n_int: int = 5, seed: int = 42) -> ConfigurationSpace:
     cs = ConfigurationSpace(seed=seed)
@@ -72,45 +82,153 @@ def create_spark_config_space(seed: int = 42) -> ConfigurationSpace:
     return cs
 
 
-def simple_objective(config_dict: dict) -> float:
-    score = 100.0
+if njit is not None:
+    @njit(cache=True)
+    def _simple_objective_core(float_0, int_0, noise):
+        out = np.empty(noise.shape[0])
+        for i in range(noise.shape[0]):
+            score = 100.0 + abs(float_0[i] - 5.0) * 10 + abs(int_0[i] - 50) * 0.5 + noise[i]
+            out[i] = max(score, 10.0)
+        return out
+
+    @njit(cache=True)
+    def _spark_objective_core(cores, memory, partitions, fraction, noise):
+        out = np.empty(noise.shape[0])
+        for i in range(noise.shape[0]):
+            score = 100.0 + abs(memory[i] / (cores[i] * 1024) - 4.0) * 10
+            if partitions[i] < 200:
+                score += (200 - partitions[i]) * 0.5
+            elif partitions[i] > 500:
+                score += (partitions[i] - 500) * 0.3
+            score += abs(fraction[i] - 0.65) * 50 + noise[i]
+            out[i] = max(score, 10.0)
+        return out
+else:
+    _simple_objective_core = None
+    _spark_objective_core = None
+
+
+def simple_objective(config_dict: dict, rng: Optional[np.random.Generator] = None) -> float:
+    return float(simple_objective_batch([config_dict], rng=rng)[0])
+
+
+def simple_objective_batch(configs, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    rng = _RNG if rng is None else rng
+    n = len(configs)
+    float_0 = int_0 = None
+    if n and 'float_param_0' in configs[0]:
+        float_0 = np.array([config['float_param_0'] for config in configs], dtype=float)
+    if n and 'int_param_0' in configs[0]:
+        int_0 = np.array([config['int_param_0'] for config in configs], dtype=float)
+    
+    if _simple_objective_core is not None and float_0 is not None and int_0 is not None:
+        return _simple_objective_core(float_0, int_0, rng.normal(0, 5, n))
+    
+    score = np.full(n, 100.0)
     
-    if 'float_param_0' in config_dict:
-        score += abs(config_dict['float_param_0'] - 5.0) * 10
+    if float_0 is not None:
+        score += np.abs(float_0 - 5.0) * 10
     
-    if 'int_param_0' in config_dict:
-        score += abs(config_dict['int_param_0'] - 50) * 0.5
+    if int_0 is not None:
+        score += np.abs(int_0 - 50) * 0.5
     
-    score += np.random.normal(0, 5)
+    score += rng.normal(0, 5, n)
     
-    return max(score, 10.0)
+    return np.maximum(score, 10.0)
 
 
-def spark_objective(config_dict: dict) -> float:
-    score = 100.0
+def spark_objective(config_dict: dict, rng: Optional[np.random.Generator] = None) -> float:
+    return float(spark_objective_batch([config_dict], rng=rng)[0])
+
+
+_SPARK_OBJECTIVE_PARAMS = [
+    'spark.executor.cores',
+    'spark.executor.memory',
+    'spark.sql.shuffle.partitions',
+    'spark.memory.fraction',
+]
+
+
+def spark_objective_batch(configs, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    names = [name for name in _SPARK_OBJECTIVE_PARAMS if configs and name in configs[0]]
+    X, col = configs_to_array(configs, names)
+    return spark_objective_array(X.reshape(len(configs), len(names)), col, rng=rng)
+
+
+def configs_to_array(configs, names: List[str]):
+    col = {name: i for i, name in enumerate(names)}
+    X = np.array([[config[name] for name in names] for config in configs], dtype=float)
+    return X, col
+
+
+def spark_objective_array(X: np.ndarray, col: dict, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    rng = _RNG if rng is None else rng
+    
+    if _spark_objective_core is not None and all(name in col for name in _SPARK_OBJECTIVE_PARAMS):
+        columns = [np.ascontiguousarray(X[:, col[name]]) for name in _SPARK_OBJECTIVE_PARAMS]
+        return _spark_objective_core(*columns, rng.normal(0, 10, X.shape[0]))
     
-    if 'spark.executor.cores' in config_dict and 'spark.executor.memory' in config_dict:
-        cores = config_dict['spark.executor.cores']
-        memory = config_dict['spark.executor.memory']
+    score = np.full(X.shape[0], 100.0)
+    
+    if 'spark.executor.cores' in col and 'spark.executor.memory' in col:
+        cores = X[:, col['spark.executor.cores']]
+        memory = X[:, col['spark.executor.memory']]
         ratio = memory / (cores * 1024)
         ideal_ratio = 4.0
-        ratio_penalty = abs(ratio - ideal_ratio) * 10
-        score += ratio_penalty
+        score += np.abs(ratio - ideal_ratio) * 10
     
-    if 'spark.sql.shuffle.partitions' in config_dict:
-        partitions = config_dict['spark.sql.shuffle.partitions']
-        if partitions < 200:
-            score += (200 - partitions) * 0.5
-        elif partitions > 500:
-            score += (partitions - 500) * 0.3
+    if 'spark.sql.shuffle.partitions' in col:
+        partitions = X[:, col['spark.sql.shuffle.partitions']]
+        score += np.where(partitions < 200, (200 - partitions) * 0.5,
+                          np.where(partitions > 500, (partitions - 500) * 0.3, 0.0))
     
-    if 'spark.memory.fraction' in config_dict:
-        fraction = config_dict['spark.memory.fraction']
-        score += abs(fraction - 0.65) * 50
+    if 'spark.memory.fraction' in col:
+        fraction = X[:, col['spark.memory.fraction']]
+        score += np.abs(fraction - 0.65) * 50
     
-    score += np.random.normal(0, 10)
+    score += rng.normal(0, 10, X.shape[0])
     
-    return max(score, 10.0)
+    return np.maximum(score, 10.0)
+
+
+def sample_configurations(config_space: ConfigurationSpace, n_samples: int) -> List[Configuration]:
+    # One batched sample_configuration call instead of n separate ones;
+    # ConfigSpace returns a bare Configuration when size == 1
+    if n_samples <= 0:
+        return []
+    configs = config_space.sample_configuration(size=n_samples)
+    if isinstance(configs, Configuration):
+        configs = [configs]
+    return configs
+
+
+def _evaluate_objectives(objective_func: Callable, configs: List[Configuration], n_workers: int = 1) -> list:
+    # Configurations are read-only mappings, so objectives can index them
+    # directly; only worker processes get plain dicts, which pickle cheaply
+    if n_workers <= 1 or len(configs) <= 1:
+        return [objective_func(config) for config in configs]
+
+    try:
+        pickle.dumps(objective_func)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Closures and lambdas cannot be sent to worker processes
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(objective_func, configs))
+
+    config_dicts = [config.get_dictionary() for config in configs]
+    chunksize = max(1, len(config_dicts) // (4 * n_workers))
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(objective_func, config_dicts, chunksize=chunksize))
+
+
+_OBSERVATION_KWARGS = dict(constraints=None, trial_state=SUCCESS, elapsed_time=0.1)
+
+
+def _make_observations(configs: List[Configuration], obj_values) -> List[Observation]:
+    return [
+        Observation(config=config, objectives=[float(obj_value)], **_OBSERVATION_KWARGS)
+        for config, obj_value in zip(configs, obj_values)
+    ]
 
 
 def generate_history(
@@ -118,9 +236,12 @@ def generate_history(
     n_samples: int = 50,
     task_id: str = 'task',
     objective_func: Optional[Callable] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    batch_objective_func: Optional[Callable] = None,
+    n_workers: int = 1
 ) -> History:
-    return generate_mock_history(config_space, n_samples, task_id, objective_func, verbose)
+    return generate_mock_history(config_space, n_samples, task_id, objective_func, verbose,
+                                 batch_objective_func=batch_objective_func, n_workers=n_workers)
 
 
 def generate_mock_history(
@@ -128,8 +249,18 @@ def generate_mock_history(
     n_samples: int = 50,
     task_id: str = 'task',
     objective_func: Optional[Callable] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    batch_objective_func: Optional[Callable] = None,
+    n_workers: int = 1
 ) -> History:
+    """
+    batch_objective_func, if given, receives the full list of sampled
+    configurations and returns one objective value per configuration.
+    It takes precedence over objective_func.
+    
+    n_workers > 1 evaluates objective_func in a process pool (thread pool
+    if the function cannot be pickled); only worth it for costly objectives.
+    """
     if verbose:
         print(f"\n📊 Generating mock history data: {n_samples} samples")
     
@@ -140,30 +271,26 @@ def generate_mock_history(
         config_space=config_space
     )
     
-    if objective_func is None:
-        objective_func = simple_objective
-    
-    observations = []
-    for _ in range(n_samples):
-        config = config_space.sample_configuration()
-        obj_value = objective_func(config.get_dictionary())
-        
-        obs = Observation(
-            config=config,
-            objectives=[obj_value],
-            constraints=None,
-            trial_state=SUCCESS,
-            elapsed_time=0.1
-        )
-        observations.append(obs)
+    if objective_func is None and batch_objective_func is None:
+        batch_objective_func = simple_objective_batch
+    
+    configs = sample_configurations(config_space, n_samples)
+    
+    if batch_objective_func is not None:
+        obj_values = batch_objective_func(configs)
+    else:
+        obj_values = _evaluate_objectives(objective_func, configs, n_workers)
+    
+    observations = _make_observations(configs, obj_values)
     
     history.update_observations(observations)
     
-    if verbose:
-        objectives = [obs.objectives[0] for obs in observations]
-        print(f"  - Objective range: [{min(objectives):.2f}, {max(objectives):.2f}]")
-        print(f"  - Best value: {min(objectives):.2f}")
-        print(f"  - Mean value: {np.mean(objectives):.2f}")
+    if verbose and len(obj_values):
+        obj_values = np.asarray(obj_values, dtype=float)
+        best = obj_values.min()
+        print(f"  - Objective range: [{best:.2f}, {obj_values.max():.2f}]")
+        print(f"  - Best value: {best:.2f}")
+        print(f"  - Mean value: {obj_values.mean():.2f}")
     
     return history
 
@@ -187,31 +314,20 @@ def generate_improving_history(
         config_space=config_space
     )
     
+    configs = sample_configurations(config_space, n_samples)
     if objective_func is None:
-        objective_func = simple_objective
-    
-    observations = []
-    for i in range(n_samples):
-        config = config_space.sample_configuration()
-        obj_value = objective_func(config.get_dictionary())
-        
-        if i == 0:
-            obj_value -= (iteration + 1) * improvement_rate
-            obj_value -= np.random.uniform(1, 3)
-        else:
-            obj_value -= iteration * improvement_rate
-            obj_value += np.random.normal(0, 1)
-        
-        obj_value = max(obj_value, 10.0)
-        
-        obs = Observation(
-            config=config,
-            objectives=[obj_value],
-            constraints=None,
-            trial_state=SUCCESS,
-            elapsed_time=0.1
-        )
-        observations.append(obs)
+        obj_values = simple_objective_batch(configs)
+    else:
+        obj_values = np.array([objective_func(config) for config in configs], dtype=float)
+    
+    # Every sample improves with the iteration; the first one gets an extra
+    # boost so each round produces a new best
+    offsets = _RNG.normal(0, 1, len(configs)) - iteration * improvement_rate
+    if len(configs):
+        offsets[0] = -(iteration + 1) * improvement_rate - _RNG.uniform(1, 3)
+    obj_values = np.maximum(obj_values + offsets, 10.0)
+    
+    observations = _make_observations(configs, obj_values)
     
     history.update_observations(observations)
     
@@ -35,6 +35,9 @@ setup(
     python_requires='>=3.7',
     install_requires=read_requirements('requirements.txt'),
     extras_require={
+        'streaming': [
+            'ijson>=3.1',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from ConfigSpace import ConfigurationSpace
+from ConfigSpace.hyperparameters import (
+    CategoricalHyperparameter,
+    UniformFloatHyperparameter,
+    UniformIntegerHyperparameter,
+)
+
+from dimensio.steps.dimension.adaptive import AdaptiveDimensionStep
+from dimensio.steps.dimension.importance import ImportanceCalculator
+from dimensio.steps.dimension.shap import SHAPDimensionStep
+from dimensio.utils import extract_numeric_hyperparameters
+
+
+def _select(step, sorted_indices, n_params):
+    # Steps 2-4 of DimensionSelectionStep.compress on a method ordering
+    names = [f'x{i}' for i in range(n_params)]
+    name_to_idx = {name: i for i, name in enumerate(names)}
+    exclude = {name_to_idx[name] for name in step.exclude_params}
+    expert = [name_to_idx[name] for name in step.expert_params if name_to_idx[name] not in exclude]
+    method = [idx for idx in sorted_indices if idx not in exclude and idx not in expert]
+    return step._merge_expert_and_method_params(expert, method, ConfigurationSpace())
+
+
+@pytest.mark.parametrize('topk', [1, 3, 8, 30])
+@pytest.mark.parametrize('exclude_params, expert_params', [
+    ([], []),
+    (['x0', 'x5'], []),
+    ([], ['x2', 'x7']),
+    (['x1', 'x2'], ['x2', 'x9', 'x11']),
+])
+def test_argsort_importances_selects_like_full_argsort(topk, exclude_params, expert_params):
+    n_params = 20
+    step = SHAPDimensionStep(topk=topk, exclude_params=exclude_params, expert_params=expert_params)
+    rng = np.random.default_rng(topk)
+    for _ in range(20):
+        importances = rng.permutation(n_params) + rng.random(n_params)
+        partial = step._argsort_importances(importances, step._get_target_topk())
+        full = np.argsort(importances).tolist()
+
+        assert sorted(partial) == list(range(n_params))
+        assert _select(step, partial, n_params) == _select(step, full, n_params)
+
+
+def test_argsort_importances_without_topk_is_full_argsort():
+    step = SHAPDimensionStep(topk=5)
+    importances = np.random.default_rng(0).random(12)
+    assert step._argsort_importances(importances, None) == np.argsort(importances).tolist()
+
+
+class _FixedImportances(ImportanceCalculator):
+    # Importance i for the i-th numeric parameter; counts how often it is asked
+    def __init__(self):
+        self.calls = 0
+
+    def calculate_importances(self, input_space, space_history=None, source_similarities=None):
+        self.calls += 1
+        names, _ = extract_numeric_hyperparameters(input_space)
+        return names, np.arange(len(names), dtype=float)
+
+    def get_name(self) -> str:
+        return 'fixed'
+
+
+def _make_mixed_space():
+    space = ConfigurationSpace()
+    space.add_hyperparameters([
+        UniformFloatHyperparameter('f0', 0.0, 1.0, default_value=0.5),
+        CategoricalHyperparameter('c0', ['a', 'b'], default_value='a'),
+        UniformIntegerHyperparameter('i0', 1, 10, default_value=5),
+        CategoricalHyperparameter('c1', ['x', 'y', 'z'], default_value='x'),
+        UniformFloatHyperparameter('f1', -1.0, 1.0, default_value=0.0),
+    ])
+    return space
+
+
+@pytest.mark.parametrize('initial_topk, max_dimensions, expected, calls', [
+    (10, None, ['f0', 'i0', 'f1'], 0),    # covers every numeric parameter: importances skipped
+    (3, None, ['f0', 'i0', 'f1'], 0),
+    (10, 2, ['f0', 'i0', 'f1'], 1),
+    (2, None, ['f0', 'i0'], 1),
+])
+def test_adaptive_selection_keeps_numeric_parameters_only(initial_topk, max_dimensions, expected, calls):
+    space = _make_mixed_space()
+    calculator = _FixedImportances()
+    step = AdaptiveDimensionStep(importance_calculator=calculator, update_strategy=None,
+                                 initial_topk=initial_topk, max_dimensions=max_dimensions)
+
+    step.compress(space, space_history=[SimpleNamespace(observations=[])])
+    assert step.selected_param_names == expected
+    assert calculator.calls == calls
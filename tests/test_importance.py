@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+from scipy.stats import rankdata
+
+from dimensio.steps.dimension.importance import _rankdata_cols
+
+
+@pytest.mark.parametrize('shape', [(1, 3), (7, 1), (50, 6)])
+def test_rankdata_cols_matches_scipy_without_ties(shape):
+    data = np.random.default_rng(0).normal(size=shape)
+    np.testing.assert_allclose(_rankdata_cols(data), rankdata(data, axis=0, method='average'))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_rankdata_cols_matches_scipy_with_ties(seed):
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 4, size=(40, 5)).astype(float)
+    # Constant column and a column tied with a neighbouring one
+    data[:, 0] = 1.0
+    data[:, 3] = data[:, 2]
+    np.testing.assert_allclose(_rankdata_cols(data), rankdata(data, axis=0, method='average'))
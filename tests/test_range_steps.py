@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+import dimensio.steps.range.boundary as boundary_range
+import dimensio.steps.range.shap as shap_range
+from dimensio.steps.range.boundary import BoundaryRangeStep
+from dimensio.steps.range.shap import SHAPBoundaryRangeStep
+
+
+def _shap_ranges_per_column(X, shap_vals, history_indices, lowers, uppers, sigma, source_similarities):
+    # Per-parameter loop of SHAPBoundaryRangeStep._compute_shap_based_ranges before vectorization
+    ranges = []
+    for i in range(X.shape[1]):
+        param_shap = shap_vals[:, i]
+        param_values = X[:, i]
+        beneficial_mask = param_shap < 0
+        beneficial_values = param_values[beneficial_mask]
+        beneficial_shap = param_shap[beneficial_mask]
+        beneficial_history_indices = history_indices[beneficial_mask]
+        if len(beneficial_values) == 0:
+            beneficial_values = param_values
+            beneficial_shap = np.ones_like(param_values)
+            beneficial_history_indices = history_indices
+        else:
+            beneficial_shap = -beneficial_shap
+
+        if source_similarities:
+            beneficial_similarities = np.array([
+                source_similarities.get(idx, 0.0) for idx in beneficial_history_indices
+            ])
+        else:
+            beneficial_similarities = np.ones_like(beneficial_shap)
+        combined_weights = beneficial_shap * beneficial_similarities
+        if combined_weights.sum() < 1e-10:
+            weights = np.ones_like(combined_weights) / len(combined_weights)
+        else:
+            weights = combined_weights / combined_weights.sum()
+
+        weighted_mean = np.average(beneficial_values, weights=weights)
+        weighted_std = np.sqrt(np.average((beneficial_values - weighted_mean) ** 2, weights=weights))
+        min_val_norm = max(np.min(beneficial_values), weighted_mean - sigma * weighted_std)
+        max_val_norm = min(np.max(beneficial_values), weighted_mean + sigma * weighted_std)
+
+        range_size = uppers[i] - lowers[i]
+        ranges.append(SHAPBoundaryRangeStep._clamp_range_bounds(
+            lowers[i] + min_val_norm * range_size, lowers[i] + max_val_norm * range_size,
+            lowers[i] + beneficial_values * range_size, lowers[i], uppers[i]
+        ))
+    return ranges
+
+
+@pytest.mark.parametrize('source_similarities', [None, {0: 0.7, 1: 0.0, 2: 1.3}, {0: 0.0, 1: 0.0, 2: 0.0}])
+@pytest.mark.parametrize('seed', range(3))
+def test_shap_range_moments_match_per_column_loop(monkeypatch, seed, source_similarities):
+    rng = np.random.default_rng(seed)
+    n_samples, n_params = 60, 6
+    X = rng.random((n_samples, n_params))
+    y = rng.normal(size=n_samples)
+    history_indices = rng.integers(0, 3, size=n_samples)
+    shap_vals = rng.normal(size=(n_samples, n_params))
+    shap_vals[:, 1] = np.abs(shap_vals[:, 1])       # no beneficial samples
+    shap_vals[:, 2] = 0.0                           # no beneficial samples, all-zero SHAP
+    shap_vals[history_indices != 1, 3] = np.abs(shap_vals[history_indices != 1, 3])  # beneficial only in task 1
+    lowers = rng.uniform(-10.0, 0.0, n_params)
+    uppers = lowers + rng.uniform(1.0, 50.0, n_params)
+    names = [f'x{i}' for i in range(n_params)]
+
+    monkeypatch.setattr(shap_range, 'extract_top_samples_from_history',
+                        lambda *args, **kwargs: (X, y, history_indices))
+    step = SHAPBoundaryRangeStep(sigma=1.5)
+    # SHAP values of the "previous fit" are reused, so no surrogate is trained
+    step._shap_cache = (X, y, shap_vals)
+
+    ranges = step._compute_shap_based_ranges(
+        [], names, None, source_similarities=source_similarities, bounds=(lowers, uppers)
+    )
+    expected = _shap_ranges_per_column(X, shap_vals, history_indices, lowers, uppers,
+                                       step.sigma, source_similarities)
+    assert list(ranges) == names
+    np.testing.assert_allclose([ranges[name] for name in names], expected, rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_clamp_range_bounds_vec_matches_scalar(seed):
+    rng = np.random.default_rng(seed)
+    n_samples, n_params = 15, 40
+    values = rng.uniform(-5.0, 15.0, (n_samples, n_params))
+    original_mins = rng.uniform(-2.0, 2.0, n_params)
+    original_maxs = original_mins + rng.uniform(1.0, 10.0, n_params)
+    min_vals = rng.uniform(-5.0, 15.0, n_params)
+    max_vals = rng.uniform(-5.0, 15.0, n_params)    # roughly half of the ranges are inverted
+
+    vec_mins, vec_maxs = BoundaryRangeStep._clamp_range_bounds_vec(
+        min_vals, max_vals, values.min(axis=0), values.max(axis=0), original_mins, original_maxs
+    )
+    expected = [
+        BoundaryRangeStep._clamp_range_bounds(min_vals[i], max_vals[i], values[:, i],
+                                              original_mins[i], original_maxs[i])
+        for i in range(n_params)
+    ]
+    np.testing.assert_array_equal(np.column_stack([vec_mins, vec_maxs]), expected)
+
+
+@pytest.mark.parametrize('sigma', [0.0, 0.5, 2.0])
+def test_boundary_ranges_match_per_column_clamp(monkeypatch, sigma):
+    rng = np.random.default_rng(0)
+    X = rng.random((25, 5))
+    X[:, 4] = 0.3       # constant column
+    lowers = np.array([0.0, -4.0, 1.0, 10.0, -1.0])
+    uppers = np.array([1.0, 4.0, 1000.0, 20.0, 1.0])
+    names = [f'x{i}' for i in range(5)]
+
+    monkeypatch.setattr(boundary_range, 'extract_top_samples_from_history',
+                        lambda *args, **kwargs: (X, np.zeros(len(X))))
+    step = BoundaryRangeStep(sigma=sigma)
+    ranges = step._compute_simple_ranges([], names, None, bounds=(lowers, uppers))
+
+    range_sizes = uppers - lowers
+    min_vals = lowers + np.maximum(X.min(axis=0), X.mean(axis=0) - sigma * X.std(axis=0)) * range_sizes
+    max_vals = lowers + np.minimum(X.max(axis=0), X.mean(axis=0) + sigma * X.std(axis=0)) * range_sizes
+    expected = [
+        BoundaryRangeStep._clamp_range_bounds(min_vals[i], max_vals[i], lowers[i] + X[:, i] * range_sizes[i],
+                                              lowers[i], uppers[i])
+        for i in range(5)
+    ]
+    np.testing.assert_allclose([ranges[name] for name in names], expected, rtol=1e-12)
@@ -0,0 +1,69 @@
+import gc
+
+from ConfigSpace import ConfigurationSpace
+from ConfigSpace.hyperparameters import (
+    UniformFloatHyperparameter,
+    UniformIntegerHyperparameter,
+)
+
+from dimensio.filling import DefaultValueFilling
+from dimensio.utils import extract_numeric_hyperparameters
+from dimensio.utils.space_cache import SpaceCache
+
+
+def _make_space():
+    space = ConfigurationSpace()
+    space.add_hyperparameters([
+        UniformFloatHyperparameter('x', 0.0, 1.0, default_value=0.5),
+        UniformIntegerHyperparameter('m', 0, 5, default_value=2),
+    ])
+    return space
+
+
+def _counting(calls):
+    def compute(space):
+        calls.append(len(space.get_hyperparameters()))
+        return tuple(space.get_hyperparameter_names())
+    return compute
+
+
+def test_hit_for_same_space():
+    cache, calls = SpaceCache(), []
+    space = _make_space()
+    first = cache.get(space, _counting(calls))
+    second = cache.get(space, _counting(calls))
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_entry_evicted_when_space_is_collected():
+    cache, calls = SpaceCache(), []
+    space = _make_space()
+    cache.get(space, _counting(calls))
+    assert len(cache) == 1
+
+    del space
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_recompute_after_hyperparameter_added():
+    cache, calls = SpaceCache(), []
+    space = _make_space()
+    assert cache.get(space, _counting(calls)) == ('x', 'm')
+
+    space.add_hyperparameter(UniformIntegerHyperparameter('n', 1, 10, default_value=3))
+    assert cache.get(space, _counting(calls)) == ('x', 'm', 'n')
+    assert len(calls) == 2
+    assert len(cache) == 1
+
+
+def test_callers_see_added_hyperparameters():
+    space = _make_space()
+    filling = DefaultValueFilling()
+    assert extract_numeric_hyperparameters(space) == (['x', 'm'], [0, 1])
+    assert filling.fill_missing_parameters({}, space) == {'x': 0.5, 'm': 2}
+
+    space.add_hyperparameter(UniformIntegerHyperparameter('n', 1, 10, default_value=3))
+    assert extract_numeric_hyperparameters(space) == (['x', 'm', 'n'], [0, 1, 2])
+    assert filling.fill_missing_parameters({}, space) == {'x': 0.5, 'm': 2, 'n': 3}
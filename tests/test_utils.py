@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from ConfigSpace import ConfigurationSpace
+from ConfigSpace.hyperparameters import UniformFloatHyperparameter, UniformIntegerHyperparameter
+
+from dimensio.utils import extract_numeric_values_from_configs, extract_top_samples_from_history
+
+
+class _History:
+    # Only the parts of openbox's History read by extract_top_samples_from_history
+    def __init__(self, observations):
+        self.observations = observations
+
+    def __len__(self):
+        return len(self.observations)
+
+
+def _make_space():
+    space = ConfigurationSpace()
+    space.add_hyperparameters([
+        UniformFloatHyperparameter('x', -1.0, 3.0, default_value=0.0),
+        UniformIntegerHyperparameter('n', 1, 100, default_value=10),
+    ])
+    return space
+
+
+def _make_history(rng, n_obs):
+    observations = []
+    for _ in range(n_obs):
+        config = {'x': rng.uniform(-1.0, 3.0), 'n': int(rng.integers(1, 101))}
+        objective = rng.choice([rng.normal(), np.inf, np.nan], p=[0.8, 0.1, 0.1])
+        observations.append(SimpleNamespace(config=config, objectives=[objective]))
+    return _History(observations)
+
+
+def test_extract_numeric_values_into_out_matches_return():
+    space = _make_space()
+    configs = [{'x': 2.0, 'n': 5}, {'x': -1.0}, {'n': 100}]
+    expected = extract_numeric_values_from_configs(configs, ['x', 'n'], space)
+
+    out = np.full((5, 2), np.nan)
+    extract_numeric_values_from_configs(configs, ['x', 'n'], space, out=out[1:4])
+    np.testing.assert_array_equal(out[1:4], expected)
+    assert np.isnan(out[[0, 4]]).all()
+
+
+@pytest.mark.parametrize('top_ratio', [1.0, 0.5, 0.1])
+@pytest.mark.parametrize('normalize', [True, False])
+def test_stacked_top_samples_match_list_path(top_ratio, normalize):
+    rng = np.random.default_rng(0)
+    space = _make_space()
+    histories = [_make_history(rng, 30), _History([]), _make_history(rng, 1), _make_history(rng, 17)]
+    names = ['x', 'n']
+
+    all_x, all_y, indices = extract_top_samples_from_history(
+        histories, names, space, top_ratio=top_ratio, normalize=normalize, return_history_indices=True
+    )
+    X, y, stacked_indices = extract_top_samples_from_history(
+        histories, names, space, top_ratio=top_ratio, normalize=normalize,
+        return_history_indices=True, stacked=True
+    )
+    np.testing.assert_array_equal(X, np.vstack(all_x))
+    np.testing.assert_array_equal(y, np.concatenate(all_y))
+    np.testing.assert_array_equal(stacked_indices, indices)
+
+    X_only, y_only = extract_top_samples_from_history(
+        histories, names, space, top_ratio=top_ratio, normalize=normalize, stacked=True
+    )
+    np.testing.assert_array_equal(X_only, X)
+    np.testing.assert_array_equal(y_only, y)
+
+
+def test_stacked_top_samples_without_valid_observations():
+    X, y = extract_top_samples_from_history([_History([])], ['x', 'n'], _make_space(), stacked=True)
+    assert X.shape == (0, 2)
+    assert y.shape == (0,)